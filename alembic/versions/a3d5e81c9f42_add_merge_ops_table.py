@@ -0,0 +1,35 @@
+"""add_merge_ops_table
+
+Revision ID: a3d5e81c9f42
+Revises: f2c9a8d31e67
+Create Date: 2025-10-07 14:22:05.913840
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3d5e81c9f42'
+down_revision = 'f2c9a8d31e67'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Results of completed advanced merges, keyed by the client's replay_id so
+    # retries return the original counts instead of re-running the merge
+    op.create_table(
+        'merge_ops',
+        sa.Column('replay_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('target_cid', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('counts', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['target_cid'], ['canonical_identities.cid']),
+        sa.PrimaryKeyConstraint('replay_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('merge_ops')
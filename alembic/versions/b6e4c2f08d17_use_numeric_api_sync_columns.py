@@ -0,0 +1,49 @@
+"""use_numeric_api_sync_columns
+
+Revision ID: b6e4c2f08d17
+Revises: a3d5e81c9f42
+Create Date: 2025-10-08 10:14:37.552190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e4c2f08d17'
+down_revision = 'a3d5e81c9f42'
+branch_labels = None
+depends_on = None
+
+
+# (table, column, new type, SQL type for the USING cast)
+NUMERIC_COLUMNS = [
+    ('api_connections', 'sync_interval_minutes', sa.Integer(), 'integer'),
+    ('api_connections', 'rate_limit_requests', sa.Integer(), 'integer'),
+    ('api_sync_logs', 'duration_seconds', sa.Float(), 'double precision'),
+    ('api_sync_logs', 'records_processed', sa.Integer(), 'integer'),
+    ('api_sync_logs', 'records_created', sa.Integer(), 'integer'),
+    ('api_sync_logs', 'records_updated', sa.Integer(), 'integer'),
+    ('api_sync_logs', 'records_failed', sa.Integer(), 'integer'),
+]
+
+
+def upgrade() -> None:
+    # Counts, intervals and durations were stored as strings; cast them in place
+    for table, column, new_type, sql_type in NUMERIC_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=new_type,
+            existing_type=sa.String(),
+            postgresql_using=f"NULLIF(trim({column}), '')::{sql_type}"
+        )
+
+
+def downgrade() -> None:
+    for table, column, new_type, sql_type in NUMERIC_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.String(),
+            existing_type=new_type,
+            postgresql_using=f"{column}::varchar"
+        )
@@ -0,0 +1,30 @@
+"""add_merge_ops_source_cid
+
+Revision ID: c71f4e2a9d36
+Revises: b6e4c2f08d17
+Create Date: 2025-10-08 15:47:12.604318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c71f4e2a9d36'
+down_revision = 'b6e4c2f08d17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Source of the recorded merge, so a replay_id reused for a different pair
+    # can be rejected (nullable: rows recorded before this revision have none)
+    op.add_column(
+        'merge_ops',
+        sa.Column('source_cid', postgresql.UUID(as_uuid=True), sa.ForeignKey('canonical_identities.cid'), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('merge_ops', 'source_cid')
@@ -0,0 +1,48 @@
+"""add_canonical_identity_filter_indexes
+
+Revision ID: d4e1a7c90b21
+Revises: agent_support_cols
+Create Date: 2025-10-06 10:12:31.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4e1a7c90b21'
+down_revision = 'agent_support_cols'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Filter columns used by GET /users
+    op.create_index('idx_canonical_identities_status', 'canonical_identities', ['status'], if_not_exists=True)
+    op.create_index('idx_canonical_identities_department', 'canonical_identities', ['department'], if_not_exists=True)
+    op.create_index('idx_canonical_identities_role', 'canonical_identities', ['role'], if_not_exists=True)
+    op.create_index('idx_canonical_identities_location', 'canonical_identities', ['location'], if_not_exists=True)
+
+    # Recent-activity count in the users summary (last_seen >= week_ago)
+    op.create_index('idx_canonical_identities_last_seen', 'canonical_identities', ['last_seen'], if_not_exists=True)
+
+    # Status filter combined with the default full_name sort
+    op.create_index('idx_canonical_identities_status_full_name', 'canonical_identities', ['status', 'full_name'], if_not_exists=True)
+
+    # Trigram index so ILIKE '%term%' name searches can avoid a sequential scan
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_canonical_identities_full_name_trgm "
+        "ON canonical_identities USING gin (full_name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    # idx_canonical_identities_department is left in place: bf8313ba2156 (not part
+    # of the revision chain) creates it too, so upgrade may not have added it
+    op.execute("DROP INDEX IF EXISTS idx_canonical_identities_full_name_trgm")
+    op.drop_index('idx_canonical_identities_status_full_name', table_name='canonical_identities', if_exists=True)
+    op.drop_index('idx_canonical_identities_last_seen', table_name='canonical_identities', if_exists=True)
+    op.drop_index('idx_canonical_identities_location', table_name='canonical_identities', if_exists=True)
+    op.drop_index('idx_canonical_identities_role', table_name='canonical_identities', if_exists=True)
+    op.drop_index('idx_canonical_identities_status', table_name='canonical_identities', if_exists=True)
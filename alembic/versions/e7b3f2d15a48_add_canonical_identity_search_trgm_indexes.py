@@ -0,0 +1,35 @@
+"""add_canonical_identity_search_trgm_indexes
+
+Revision ID: e7b3f2d15a48
+Revises: d4e1a7c90b21
+Create Date: 2025-10-06 11:03:54.120447
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3f2d15a48'
+down_revision = 'd4e1a7c90b21'
+branch_labels = None
+depends_on = None
+
+
+# Remaining columns searched by GET /users (full_name is covered by d4e1a7c90b21)
+SEARCH_COLUMNS = ['email', 'department', 'role', 'manager', 'location']
+
+
+def upgrade() -> None:
+    # GIN trigram indexes let the existing ILIKE '%term%' search use an index scan
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_canonical_identities_{column}_trgm "
+            f"ON canonical_identities USING gin ({column} gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    for column in SEARCH_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS idx_canonical_identities_{column}_trgm")
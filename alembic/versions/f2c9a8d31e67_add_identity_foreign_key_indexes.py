@@ -0,0 +1,34 @@
+"""add_identity_foreign_key_indexes
+
+Revision ID: f2c9a8d31e67
+Revises: e7b3f2d15a48
+Create Date: 2025-10-07 09:41:18.305276
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c9a8d31e67'
+down_revision = 'e7b3f2d15a48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Foreign keys matched by the bulk UPDATE/DELETE statements in identity merges
+    # (idx_devices_owner_cid is also in bf8313ba2156, which is not part of the revision chain)
+    op.create_index('idx_devices_owner_cid', 'devices', ['owner_cid'], if_not_exists=True)
+    op.create_index('idx_accounts_cid', 'accounts', ['cid'], if_not_exists=True)
+    op.create_index('idx_group_memberships_cid', 'group_memberships', ['cid'], if_not_exists=True)
+
+    # Activity history re-attributed by device during assignment and transfer
+    op.create_index('idx_activity_history_device_id', 'activity_history', ['device_id'], if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_activity_history_device_id', table_name='activity_history', if_exists=True)
+    op.drop_index('idx_group_memberships_cid', table_name='group_memberships', if_exists=True)
+    op.drop_index('idx_accounts_cid', table_name='accounts', if_exists=True)
+    op.drop_index('idx_devices_owner_cid', table_name='devices', if_exists=True)
@@ -50,3 +50,6 @@ class SimpleCache:
 # Global cache instance
 app_cache = SimpleCache()
 
+# Cache key for the users summary; dropped whenever users or device ownership change
+USERS_SUMMARY_CACHE_KEY = "users_summary"
+
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Enum as SQLEnum, Text, Integer, JSON
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Enum as SQLEnum, Text, Integer, Float, JSON, cast
 from sqlalchemy.dialects.postgresql import UUID, INET
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -162,7 +162,13 @@ class Device(Base):
 
     # Relationships
     owner = relationship("CanonicalIdentity", back_populates="devices")
-    tags = relationship("DeviceTag", back_populates="device", cascade="all, delete-orphan")
+    # Tags come back alphabetically so responses don't need to sort them in Python
+    tags = relationship(
+        "DeviceTag",
+        back_populates="device",
+        cascade="all, delete-orphan",
+        order_by=lambda: cast(DeviceTag.tag, String)
+    )
     # TEMP_COMMENTED: # TEMP_COMMENTED: agent_events = relationship("AgentEvent", back_populates="device", cascade="all, delete-orphan")
 
 
@@ -316,6 +322,17 @@ class ActivityHistory(Base):
     device = relationship("Device")
 
 
+class MergeOperation(Base):
+    """Completed advanced merges, keyed by the client-supplied replay_id"""
+    __tablename__ = "merge_ops"
+
+    replay_id = Column(UUID(as_uuid=True), primary_key=True)
+    source_cid = Column(UUID(as_uuid=True), ForeignKey("canonical_identities.cid"))
+    target_cid = Column(UUID(as_uuid=True), ForeignKey("canonical_identities.cid"), nullable=False)
+    counts = Column(JSON, nullable=False)  # items_transferred from the original merge
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
 class APIProviderEnum(enum.Enum):
     OKTA = "Okta"
     WORKDAY = "Workday"
@@ -382,7 +399,7 @@ class APIConnection(Base):
     
     # Configuration
     sync_enabled = Column(Boolean, nullable=False, default=True)
-    sync_interval_minutes = Column(String, default="60")  # How often to sync
+    sync_interval_minutes = Column(Integer, default=60)  # How often to sync
     last_sync = Column(DateTime(timezone=True))
     next_sync = Column(DateTime(timezone=True))
     
@@ -393,7 +410,7 @@ class APIConnection(Base):
     connection_test_url = Column(String)  # Specific endpoint to test connection
     
     # Rate limiting
-    rate_limit_requests = Column(String)  # requests per minute/hour
+    rate_limit_requests = Column(Integer)  # requests per minute/hour
     rate_limit_window = Column(String)  # minute/hour
     
     # Data mapping configuration
@@ -436,14 +453,14 @@ class APISyncLog(Base):
     sync_type = Column(String, nullable=False)  # full, incremental, manual
     started_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True))
-    duration_seconds = Column(String)
+    duration_seconds = Column(Float)
     
     # Results
     status = Column(String, nullable=False)  # success, error, partial
-    records_processed = Column(String, default="0")
-    records_created = Column(String, default="0")
-    records_updated = Column(String, default="0")
-    records_failed = Column(String, default="0")
+    records_processed = Column(Integer, default=0)
+    records_created = Column(Integer, default=0)
+    records_updated = Column(Integer, default=0)
+    records_failed = Column(Integer, default=0)
     
     # Error details
     error_message = Column(Text)
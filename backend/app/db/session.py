@@ -11,9 +11,10 @@ from backend.app.config import settings
 engine = create_engine(
     settings.get_database_url(),
     pool_pre_ping=True,
-    pool_recycle=300,
-    pool_size=10,
-    max_overflow=20,
+    pool_recycle=settings.db_pool_recycle,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
     echo=settings.debug
 )
 
@@ -23,6 +24,17 @@ SessionLocal = scoped_session(
 )
 
 
+def get_pool_status() -> dict:
+    """Current connection pool usage for status endpoints"""
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "max_overflow": settings.db_max_overflow
+    }
+
+
 def create_tables():
     """Create all tables"""
     Base.metadata.create_all(bind=engine)
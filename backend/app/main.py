@@ -327,7 +327,7 @@ def create_app() -> FastAPI:
         # Check database connectivity with timing
         db_start = time.time()
         try:
-            from backend.app.db.session import engine
+            from backend.app.db.session import engine, get_pool_status
             from sqlalchemy import text
             with engine.connect() as conn:
                 conn.execute(text("SELECT 1"))
@@ -336,7 +336,8 @@ def create_app() -> FastAPI:
                 status_data["services"]["database"] = {
                     "status": "connected", 
                     "response_time_ms": db_time,
-                    "last_check": time.time()
+                    "last_check": time.time(),
+                    "pool": get_pool_status()
                 }
         except Exception as e:
             db_time = round((time.time() - db_start) * 1000, 2)
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func, and_, or_
 from typing import Optional, List
 from uuid import UUID
@@ -47,8 +48,8 @@ def get_api_connections(
     - Filter by status to show only active/error connections
     - Use tags to organize connections by environment or type
     """
-    # Build query
-    query_filter = db.query(APIConnection)
+    # Build query; tags for the whole page are loaded in one extra SELECT
+    query_filter = db.query(APIConnection).options(selectinload(APIConnection.tags))
     
     # Apply filters
     if provider:
@@ -77,13 +78,14 @@ def get_api_connections(
     # Calculate pagination info
     total_pages = (total + page_size - 1) // page_size
     
-    return APIConnectionListResponse(
-        connections=connections,
+    response = APIConnectionListResponse.model_construct(
+        connections=[APIConnectionSchema.from_row(connection) for connection in connections],
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{connection_id}", response_model=APIConnectionSchema)
@@ -335,13 +337,14 @@ def get_api_sync_logs(
     # Calculate pagination info
     total_pages = (total + page_size - 1) // page_size
     
-    return APISyncLogListResponse(
-        logs=logs,
+    response = APISyncLogListResponse.model_construct(
+        logs=[APISyncLogSchema.from_row(log) for log in logs],
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.put("/{connection_id}/tags")
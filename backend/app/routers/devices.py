@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi import status as http_status
 from fastapi import Query as FastAPIQuery
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, asc, desc, and_, String
+from sqlalchemy import func, or_, asc, desc, and_, cast, String
 from typing import Optional, List
 from uuid import UUID
 from enum import Enum
 import random
+from collections import defaultdict
 
 from backend.app.db.session import get_db
 from backend.app.db.models import Device, CanonicalIdentity, DeviceTag, DeviceStatusEnum, DeviceTagEnum, GroupMembership, Policy, ActivityHistory, ConfigHistory, ConfigChangeTypeEnum
@@ -24,15 +26,17 @@ from backend.app.schemas import (
 from backend.app.security.auth import verify_token
 # Try to import cache, fallback if not available
 try:
-    from backend.app.cache import app_cache
+    from backend.app.cache import USERS_SUMMARY_CACHE_KEY, app_cache
 except ImportError:
     # Fallback cache implementation
     class SimpleCache:
         def get(self, key): return None
         def set(self, key, value, ttl_seconds=300): pass
+        def delete(self, key): pass
         def clear(self): pass
         def size(self): return 0
     app_cache = SimpleCache()
+    USERS_SUMMARY_CACHE_KEY = "users_summary"
 
 
 router = APIRouter(prefix="/devices", tags=["devices"])
@@ -243,8 +247,15 @@ def get_devices(
     offset = (page - 1) * page_size
     devices = base_query.offset(offset).limit(page_size).all()
     
-    # Calculate total pages
-    total_pages = (total + page_size - 1) // page_size
+    # Fetch tags for the whole page in one query, in the same order as Device.tags,
+    # instead of lazy-loading device.tags once per device
+    tags_by_device = defaultdict(list)
+    if devices:
+        tag_rows = db.query(DeviceTag.device_id, DeviceTag.id, DeviceTag.tag).filter(
+            DeviceTag.device_id.in_([device.id for device in devices])
+        ).order_by(cast(DeviceTag.tag, String)).all()
+        for device_id, tag_id, tag in tag_rows:
+            tags_by_device[device_id].append({"id": tag_id, "tag": tag})
     
     # Convert devices to schema with owner information
     device_schemas = []
@@ -262,7 +273,7 @@ def get_devices(
             "os_version": device.os_version,
             "last_check_in": device.last_check_in,
             "status": device.status,
-            "tags": sorted([{"id": tag.id, "tag": tag.tag} for tag in device.tags], key=lambda x: x["tag"].value) if device.tags else []
+            "tags": tags_by_device[device.id]
         }
         
         # Add owner information as sub-object (we always have the join now)
@@ -297,15 +308,17 @@ def get_devices(
             device_dict["groups"] = []
             device_dict["policies"] = []
         
-        device_schemas.append(DeviceSchema.model_validate(device_dict))
+        device_schemas.append(DeviceSchema.from_row(device_dict))
     
-    return DeviceListResponse(
+    response = DeviceListResponse.model_construct(
         devices=device_schemas,
         total=total,
         page=page,
-        page_size=page_size,
-        total_pages=total_pages
+        page_size=page_size
     )
+    # Serialize straight to JSON bytes with pydantic-core, skipping FastAPI's
+    # re-validation and dict round trip of the response model
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/summary", response_model=dict)
@@ -515,7 +528,7 @@ def get_device_detail(
         "os_version": device.os_version,
         "last_check_in": device.last_check_in,
         "status": device.status,
-        "tags": sorted([{"id": tag.id, "tag": tag.tag} for tag in device.tags], key=lambda x: x["tag"].value) if device.tags else []
+        "tags": [{"id": tag.id, "tag": tag.tag} for tag in device.tags]
     }
     
     # Add owner information as sub-object (we have the join now)
@@ -597,7 +610,7 @@ def update_device(
         400: Invalid owner_cid provided
     """
     
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = db.get(Device, device_id)
     
     if not device:
         raise HTTPException(
@@ -623,6 +636,8 @@ def update_device(
             setattr(device, field, value)
     
     db.commit()
+    if "owner_cid" in update_dict:
+        app_cache.delete(USERS_SUMMARY_CACHE_KEY)
     db.refresh(device)
     
     return DeviceSchema.model_validate(device)
@@ -655,7 +670,7 @@ def rename_device(
         400: Invalid name format
     """
     
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = db.get(Device, device_id)
     
     if not device:
         raise HTTPException(
@@ -722,7 +737,7 @@ def retag_device(
         400: Invalid tag values
     """
     
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = db.get(Device, device_id)
     
     if not device:
         raise HTTPException(
@@ -909,6 +924,7 @@ def merge_devices(
             )
         
         db.commit()
+        app_cache.delete(USERS_SUMMARY_CACHE_KEY)
         db.refresh(primary_device)
         
         return DeviceMergeResponse(
@@ -949,7 +965,7 @@ def delete_device(
         404: Device not found
     """
     
-    device = db.query(Device).filter(Device.id == device_id).first()
+    device = db.get(Device, device_id)
     
     if not device:
         raise HTTPException(
@@ -960,6 +976,7 @@ def delete_device(
     device_name = device.name
     db.delete(device)
     db.commit()
+    app_cache.delete(USERS_SUMMARY_CACHE_KEY)
     
     return {"message": f"Device '{device_name}' has been deleted successfully"}
 
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, desc
 from typing import Optional, List
@@ -71,13 +72,14 @@ def get_config_history(
     # Calculate pagination info
     total_pages = (total + page_size - 1) // page_size
     
-    return ConfigHistoryListResponse(
-        changes=changes,
+    response = ConfigHistoryListResponse.model_construct(
+        changes=[ConfigHistorySchema.from_row(change) for change in changes],
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/activity", response_model=ActivityHistoryListResponse)
@@ -129,21 +131,18 @@ def get_activity_history(
     # Apply pagination
     activities = query_filter.offset((page - 1) * page_size).limit(page_size).all()
     
-    # Convert IP addresses to strings for Pydantic serialization
-    for activity in activities:
-        if activity.source_ip:
-            activity.source_ip = str(activity.source_ip)
-    
     # Calculate pagination info
     total_pages = (total + page_size - 1) // page_size
     
-    return ActivityHistoryListResponse(
-        activities=activities,
+    # from_row converts the INET source_ip to the string the schema declares
+    response = ActivityHistoryListResponse.model_construct(
+        activities=[ActivityHistorySchema.from_row(activity) for activity in activities],
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.post("/activity", response_model=ActivityHistorySchema)
@@ -175,7 +174,7 @@ def create_activity_record(
     db.commit()
     db.refresh(activity)
     
-    return activity
+    return ActivityHistorySchema.from_row(activity)
 
 
 @router.get("/activity/summary/by-type")
@@ -1,14 +1,23 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, asc, desc
-from typing import Optional, List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from sqlalchemy.orm import Session, aliased, load_only, selectinload
+from sqlalchemy import func, or_, asc, desc, case, exists, cast, literal, update, String
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Iterable, Optional, List
+from pydantic import TypeAdapter
+import json
 import random
+import time
+import uuid
+from collections import defaultdict
+from itertools import islice
 from uuid import UUID
 from enum import Enum
+from datetime import datetime, timedelta
 
 from backend.app.db.session import get_db
-from backend.app.db.models import CanonicalIdentity, Device, GroupMembership, Account, StatusEnum, ConfigHistory, ConfigChangeTypeEnum, ActivityHistory
-from backend.app.utils import SortDirection, apply_pagination, apply_sorting, apply_text_search
+from backend.app.db.models import CanonicalIdentity, Device, DeviceTag, GroupMembership, Account, StatusEnum, ConfigHistory, ConfigChangeTypeEnum, ActivityHistory, MergeOperation
+from backend.app.utils import SortDirection, apply_pagination, apply_sorting, apply_text_search, chunked
 from backend.app.schemas import (
     UserListResponse, 
     UserListItemSchema, 
@@ -19,7 +28,6 @@ from backend.app.schemas import (
     IdentityUpdateRequest,
     DeviceUpdateRequest,
     DeviceListResponse,
-    DeviceSchema,
     PasswordResetRequest,
     PasswordResetResult,
     ForceCheckinRequest,
@@ -27,6 +35,8 @@ from backend.app.schemas import (
     SyncRequest,
     SyncResult,
     AdvancedMergeRequest,
+    AdvancedMergeResult,
+    MergeConflict,
     MergePreviewResult,
     FullDiskScanRequest,
     FullDiskScanResult,
@@ -42,10 +52,39 @@ from backend.app.schemas import (
     BulkDeviceManagementResult
 )
 from backend.app.security.auth import verify_token
+from backend.app.cache import USERS_SUMMARY_CACHE_KEY, app_cache
 
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+# Users seen within this window count as recently active in the summary
+RECENT_ACTIVITY_WINDOW = timedelta(days=7)
+
+# Compiled validator reused across requests instead of rebuilding per call
+_USER_DETAIL_ADAPTER = TypeAdapter(UserDetailSchema)
+
+# Identity columns read into UserDetailSchema; related lists are supplied separately
+_USER_DETAIL_COLUMNS = (
+    "cid", "email", "full_name", "department", "role",
+    "manager", "location", "last_seen", "status", "created_at"
+)
+
+# Identity fields copied onto the target by the "take_source" merge strategy
+_MERGE_COPY_FIELDS = ("full_name", "department", "role", "manager", "location")
+
+# Identity fields the "merge" strategy fills on the target when it has no value
+_MERGE_FILL_FIELDS = ("manager", "location")
+
+# Maximum IDs per IN clause when validating or updating device batches
+DEVICE_ID_CHUNK_SIZE = 500
+
+# Fields compared during merge preview, with the recommended resolution for each
+_CONFLICT_FIELDS = (
+    ("full_name", "Use target value (more recent)"),
+    ("department", "Use target value (current assignment)"),
+    ("role", "Use target value (current role)"),
+)
+
 
 def log_user_config_change(
     db: Session,
@@ -55,13 +94,18 @@ def log_user_config_change(
     field_name: str,
     old_value: str,
     new_value: str,
-    changed_by: str = "API User"
+    changed_by: str = "API User",
+    pending_logs: Optional[List[dict]] = None
 ):
     """
     Log a user-related configuration change to the audit trail.
+    
+    When pending_logs is given, the entry is appended to it as a mapping
+    instead of being added to the session; write the batch with
+    flush_user_config_changes.
     """
     try:
-        config_entry = ConfigHistory(
+        config_values = dict(
             entity_type=entity_type,
             entity_id=entity_id,
             change_type=change_type,
@@ -70,49 +114,89 @@ def log_user_config_change(
             new_value=str(new_value) if new_value is not None else None,
             changed_by=changed_by
         )
-        db.add(config_entry)
+        if pending_logs is not None:
+            pending_logs.append(config_values)
+            return
+        db.add(ConfigHistory(**config_values))
         # Note: Don't commit here - let the calling function handle the transaction
     except Exception as e:
         # Log the error but don't fail the main operation
         print(f"Warning: Failed to log user config change: {str(e)}")
 
 
+def flush_user_config_changes(db: Session, pending_logs: List[dict]):
+    """
+    Write accumulated audit entries in a single executemany INSERT.
+    """
+    if pending_logs:
+        db.bulk_insert_mappings(ConfigHistory, pending_logs)
+
+
+def _user_exists(db: Session, cid: UUID) -> bool:
+    """Check whether a canonical identity exists without loading it."""
+    return db.query(exists().where(CanonicalIdentity.cid == cid)).scalar()
+
+
 def get_devices_with_owner_info(db: Session, owner_cid: UUID) -> List[dict]:
     """
     Helper function to get devices with complete owner information.
     Returns devices in consistent schema format across all endpoints.
     """
-    devices = db.query(Device).join(CanonicalIdentity, Device.owner_cid == CanonicalIdentity.cid).filter(Device.owner_cid == owner_cid).all()
+    # Select plain columns (no ORM instances); owner fields come from the join
+    device_rows = db.query(
+        Device.id,
+        Device.name,
+        Device.last_seen,
+        Device.compliant,
+        Device.owner_cid,
+        Device.ip_address,
+        Device.mac_address,
+        Device.vlan,
+        Device.os_version,
+        Device.last_check_in,
+        Device.status,
+        CanonicalIdentity.full_name.label("owner_name"),
+        CanonicalIdentity.email.label("owner_email"),
+        CanonicalIdentity.department.label("owner_department")
+    ).join(
+        CanonicalIdentity, Device.owner_cid == CanonicalIdentity.cid
+    ).filter(Device.owner_cid == owner_cid).all()
+    
+    # Fetch tags for all devices in one query, in the same order as Device.tags
+    tags_by_device = defaultdict(list)
+    if device_rows:
+        tag_rows = db.query(DeviceTag.device_id, DeviceTag.id, DeviceTag.tag).filter(
+            DeviceTag.device_id.in_([row.id for row in device_rows])
+        ).order_by(cast(DeviceTag.tag, String)).all()
+        for device_id, tag_id, tag in tag_rows:
+            tags_by_device[device_id].append({"id": tag_id, "tag": tag})
     
     device_list = []
-    for device in devices:
-        device_dict = {
-            "id": device.id,
-            "name": device.name,
-            "last_seen": device.last_seen,
-            "compliant": device.compliant,
-            "owner_cid": device.owner_cid,
-            "ip_address": str(device.ip_address) if device.ip_address else None,
-            "mac_address": device.mac_address,
-            "vlan": device.vlan,
-            "os_version": device.os_version,
-            "last_check_in": device.last_check_in,
-            "status": device.status,
-            "tags": sorted([{"id": tag.id, "tag": tag.tag} for tag in device.tags], key=lambda x: x["tag"].value) if device.tags else []
-        }
-        
-        # Add owner information (we have the join)
-        device_dict.update({
-            "owner_name": device.owner.full_name if hasattr(device, 'owner') and device.owner else None,
-            "owner_email": device.owner.email if hasattr(device, 'owner') and device.owner else None,
-            "owner_department": device.owner.department if hasattr(device, 'owner') and device.owner else None
-        })
-        
+    for row in device_rows:
+        device_dict = dict(row._mapping)
+        device_dict["ip_address"] = str(row.ip_address) if row.ip_address else None
+        device_dict["tags"] = tags_by_device[row.id]
         device_list.append(device_dict)
     
     return device_list
 
 
+def _build_user_detail(user: CanonicalIdentity, devices: List[dict]) -> UserDetailSchema:
+    """
+    Validate the user detail response from already-fetched data.
+    
+    Only the identity columns, group memberships and accounts are read from
+    the user, so the user.devices relationship (and each device's tags) is
+    never lazy-loaded; devices come from get_devices_with_owner_info.
+    """
+    return _USER_DETAIL_ADAPTER.validate_python({
+        **{field_name: getattr(user, field_name) for field_name in _USER_DETAIL_COLUMNS},
+        "devices": devices,
+        "groups": user.group_memberships,
+        "accounts": user.accounts
+    }, from_attributes=True)
+
+
 class UserSortBy(str, Enum):
     """Available columns for sorting users"""
     email = "email"
@@ -126,6 +210,42 @@ class UserSortBy(str, Enum):
     location = "location"
 
 
+# Built once at import; filter values are bound parameters, so the SQL
+# compiled for each filter/sort combination is reused from the engine cache
+USER_SORT_MAPPING = {
+    UserSortBy.email: CanonicalIdentity.email,
+    UserSortBy.full_name: CanonicalIdentity.full_name,
+    UserSortBy.department: CanonicalIdentity.department,
+    UserSortBy.role: CanonicalIdentity.role,
+    UserSortBy.last_seen: CanonicalIdentity.last_seen,
+    UserSortBy.status: CanonicalIdentity.status,
+    UserSortBy.created_at: CanonicalIdentity.created_at,
+    UserSortBy.manager: CanonicalIdentity.manager,
+    UserSortBy.location: CanonicalIdentity.location
+}
+
+USER_SEARCH_COLUMNS = [
+    CanonicalIdentity.email,
+    CanonicalIdentity.full_name,
+    CanonicalIdentity.department,
+    CanonicalIdentity.role,
+    CanonicalIdentity.manager,
+    CanonicalIdentity.location
+]
+
+# Columns selected for each row of the user list
+USER_LIST_COLUMNS = (
+    CanonicalIdentity.cid,
+    CanonicalIdentity.email,
+    CanonicalIdentity.full_name,
+    CanonicalIdentity.department,
+    CanonicalIdentity.role,
+    CanonicalIdentity.location,
+    CanonicalIdentity.last_seen,
+    CanonicalIdentity.status,
+)
+
+
 @router.get("", response_model=UserListResponse)
 def get_users(
     page: int = Query(1, ge=1, description="Page number"),
@@ -163,8 +283,8 @@ def get_users(
         Paginated list of users with filtering and sorting applied
     """
     
-    # Build base query
-    base_query = db.query(CanonicalIdentity)
+    # Build base query over plain column rows (no ORM instances) for the list view
+    base_query = db.query(*USER_LIST_COLUMNS)
     
     # Apply filters
     if status:
@@ -181,64 +301,48 @@ def get_users(
     
     # Enhanced search functionality
     if query:
-        search_columns = [
-            CanonicalIdentity.email,
-            CanonicalIdentity.full_name,
-            CanonicalIdentity.department,
-            CanonicalIdentity.role,
-            CanonicalIdentity.manager,
-            CanonicalIdentity.location
-        ]
-        base_query = apply_text_search(base_query, query, search_columns)
+        base_query = apply_text_search(base_query, query, USER_SEARCH_COLUMNS)
     
     # Apply sorting
-    sort_mapping = {
-        UserSortBy.email: CanonicalIdentity.email,
-        UserSortBy.full_name: CanonicalIdentity.full_name,
-        UserSortBy.department: CanonicalIdentity.department,
-        UserSortBy.role: CanonicalIdentity.role,
-        UserSortBy.last_seen: CanonicalIdentity.last_seen,
-        UserSortBy.status: CanonicalIdentity.status,
-        UserSortBy.created_at: CanonicalIdentity.created_at,
-        UserSortBy.manager: CanonicalIdentity.manager,
-        UserSortBy.location: CanonicalIdentity.location
-    }
-    base_query = apply_sorting(base_query, sort_by.value, sort_direction, sort_mapping)
+    base_query = apply_sorting(base_query, sort_by.value, sort_direction, USER_SORT_MAPPING)
     
     # Apply pagination using utility function
-    users, total, total_pages = apply_pagination(base_query, page, page_size)
+    users, total, _ = apply_pagination(base_query, page, page_size)
+    
+    # Fetch device and group counts for the whole page in one GROUP BY query each
+    page_cids = [user.cid for user in users]
+    device_counts = dict(
+        db.query(Device.owner_cid, func.count(Device.id))
+        .filter(Device.owner_cid.in_(page_cids))
+        .group_by(Device.owner_cid)
+        .all()
+    ) if page_cids else {}
+    groups_counts = dict(
+        db.query(GroupMembership.cid, func.count(GroupMembership.id))
+        .filter(GroupMembership.cid.in_(page_cids))
+        .group_by(GroupMembership.cid)
+        .all()
+    ) if page_cids else {}
     
     # Enhance users with device and group counts
-    enhanced_users = []
-    for user in users:
-        # Get device count for this user
-        device_count = db.query(Device).filter(Device.owner_cid == user.cid).count()
-        
-        # Get group membership count for this user
-        groups_count = db.query(GroupMembership).filter(GroupMembership.cid == user.cid).count()
-        
-        # Create enhanced user object
-        enhanced_user = UserListItemSchema(
-            cid=user.cid,
-            email=user.email,
-            full_name=user.full_name,
-            department=user.department,
-            role=user.role,
-            location=user.location,
-            last_seen=user.last_seen,
-            status=user.status,
-            device_count=device_count,
-            groups_count=groups_count
+    enhanced_users = [
+        UserListItemSchema.from_row(
+            user,
+            device_count=device_counts.get(user.cid, 0),
+            groups_count=groups_counts.get(user.cid, 0)
         )
-        enhanced_users.append(enhanced_user)
+        for user in users
+    ]
     
-    return UserListResponse(
+    response = UserListResponse.model_construct(
         users=enhanced_users,
         total=total,
         page=page,
-        page_size=page_size,
-        total_pages=total_pages
+        page_size=page_size
     )
+    # Serialize straight to JSON bytes with pydantic-core, skipping FastAPI's
+    # re-validation and dict round trip of the response model
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get("/summary")
@@ -253,23 +357,31 @@ def get_users_summary(
     - Provides key user metrics for dashboard cards
     - Includes user counts, status breakdown, department distribution
     - Perfect for users summary widgets
+    - Cached for 30 seconds, invalidated on user and device ownership changes
     
     Returns:
         Users summary with counts, status breakdown, and key metrics
     """
     
+    cached_result = app_cache.get(USERS_SUMMARY_CACHE_KEY)
+    if cached_result is not None:
+        return cached_result
+    
     try:
-        # Total users
-        total_users = db.query(CanonicalIdentity).count()
-        
-        # Users by status
-        active_users = db.query(CanonicalIdentity).filter(
-            CanonicalIdentity.status == StatusEnum.ACTIVE
-        ).count()
+        recent_threshold = datetime.utcnow() - RECENT_ACTIVITY_WINDOW
+        
+        # Total, active and recently seen users in a single scan
+        overview_stats = db.query(
+            func.count(CanonicalIdentity.cid).label('total'),
+            func.sum(case((CanonicalIdentity.status == StatusEnum.ACTIVE, 1), else_=0)).label('active'),
+            func.sum(case((CanonicalIdentity.last_seen >= recent_threshold, 1), else_=0)).label('recent')
+        ).one()
+        total_users = overview_stats.total
+        active_users = int(overview_stats.active or 0)
         disabled_users = total_users - active_users
         
         # Users with devices
-        users_with_devices = db.query(CanonicalIdentity).join(Device).distinct().count()
+        users_with_devices = db.query(func.count(func.distinct(Device.owner_cid))).scalar() or 0
         users_without_devices = total_users - users_with_devices
         
         # Department breakdown (top 5)
@@ -296,14 +408,10 @@ def get_users_summary(
             CanonicalIdentity.location
         ).order_by(func.count(CanonicalIdentity.cid).desc()).limit(5).all()
         
-        # Recent user activity (users seen in last 7 days)
-        from datetime import datetime, timedelta
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_active_users = db.query(CanonicalIdentity).filter(
-            CanonicalIdentity.last_seen >= week_ago
-        ).count()
+        # Recent user activity (users seen within RECENT_ACTIVITY_WINDOW)
+        recent_active_users = int(overview_stats.recent or 0)
         
-        return {
+        result = {
             "overview": {
                 "total_users": total_users,
                 "active_users": active_users,
@@ -340,6 +448,10 @@ def get_users_summary(
             }
         }
         
+        # Cache for 30 seconds; user/device mutations invalidate it sooner
+        app_cache.set(USERS_SUMMARY_CACHE_KEY, result, ttl_seconds=30)
+        return result
+        
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -347,10 +459,195 @@ def get_users_summary(
         )
 
 
+# How long background disk scan results stay available for polling
+DISK_SCAN_RESULT_TTL_SECONDS = 3600
+
+# Devices fetched and simulated per batch when streaming a disk scan
+DISK_SCAN_BATCH_SIZE = 500
+
+# Simulated files scanned per device for each scan depth
+_SCAN_DEPTH_MULTIPLIERS = {
+    'quick': 1000,
+    'standard': 5000,
+    'deep': 15000
+}
+
+_DISK_SCAN_ISSUES = [
+    "Unauthorized file access in /tmp",
+    "Outdated security certificates",
+    "Suspicious network connections"
+]
+
+
+def _draw_files_scanned(scan_multiplier: int, device_count: int) -> List[int]:
+    """Draw simulated files-scanned counts for all devices in one call."""
+    return random.choices(range(scan_multiplier, scan_multiplier * 2 + 1), k=device_count)
+
+
+def _simulate_device_disk_scan(device: Device, device_files: int) -> tuple[dict, float]:
+    """
+    Simulate a full disk scan of one device that scanned device_files files.
+    Returns the per-device result entry and the unrounded disk usage in GB.
+    """
+    device_issues = random.randint(0, max(1, device_files // 1000))
+    device_disk_gb = random.uniform(50.0, 500.0)
+    device_alerts = random.randint(0, max(1, device_issues // 2))
+    
+    device_result = {
+        "device_id": str(device.id),
+        "device_name": device.name,
+        "files_scanned": device_files,
+        "issues_found": device_issues,
+        "disk_usage_gb": round(device_disk_gb, 2),
+        "security_alerts": device_alerts,
+        "scan_duration_seconds": round(random.uniform(30.0, 300.0), 2),
+        "compliance_status": "compliant" if device_issues < 3 else "non_compliant",
+        "top_issues": _DISK_SCAN_ISSUES[:device_alerts] if device_alerts > 0 else []
+    }
+    return device_result, device_disk_gb
+
+
+def _build_disk_scan_summary(
+    devices_scanned: int,
+    non_compliant_devices: int,
+    total_issues: int,
+    total_security_alerts: int
+) -> str:
+    """Human-readable summary for a full disk scan."""
+    compliance_rate = (devices_scanned - non_compliant_devices) / devices_scanned * 100 if devices_scanned else 100
+    
+    scan_summary = f"Full disk scan completed for {devices_scanned} devices. "
+    scan_summary += f"Compliance rate: {compliance_rate:.1f}%. "
+    scan_summary += f"Found {total_issues} issues requiring attention. "
+    if total_security_alerts > 0:
+        scan_summary += f"{total_security_alerts} security alerts detected."
+    else:
+        scan_summary += "No critical security alerts."
+    return scan_summary
+
+
+def _stream_full_disk_scan(
+    scan_id: UUID,
+    cid: UUID,
+    devices: Iterable,
+    scan_multiplier: int,
+    scan_start: float
+):
+    """
+    Yield full disk scan results as NDJSON: one "device" line per device,
+    followed by a final "summary" line with the aggregate totals.
+    
+    devices may be a lazily fetched result (e.g. Query.yield_per); it is
+    consumed in batches so only one batch is held in memory at a time.
+    """
+    
+    devices_scanned = 0
+    total_files = 0
+    total_issues = 0
+    total_disk_usage = 0.0
+    total_security_alerts = 0
+    non_compliant_devices = 0
+    
+    device_iter = iter(devices)
+    while batch := list(islice(device_iter, DISK_SCAN_BATCH_SIZE)):
+        files_per_device = _draw_files_scanned(scan_multiplier, len(batch))
+        for device, device_files in zip(batch, files_per_device):
+            device_result, device_disk_gb = _simulate_device_disk_scan(device, device_files)
+            devices_scanned += 1
+            total_files += device_result["files_scanned"]
+            total_issues += device_result["issues_found"]
+            total_disk_usage += device_disk_gb
+            total_security_alerts += device_result["security_alerts"]
+            if device_result["compliance_status"] == "non_compliant":
+                non_compliant_devices += 1
+            yield json.dumps({"type": "device", **device_result}) + "\n"
+    
+    yield json.dumps({
+        "type": "summary",
+        "scan_id": str(scan_id),
+        "user_cid": str(cid),
+        "devices_scanned": devices_scanned,
+        "scan_duration_seconds": round(time.perf_counter() - scan_start, 2),
+        "files_scanned": total_files,
+        "issues_found": total_issues,
+        "disk_usage_gb": round(total_disk_usage, 2),
+        "security_alerts": total_security_alerts,
+        "scan_summary": _build_disk_scan_summary(
+            devices_scanned, non_compliant_devices, total_issues, total_security_alerts
+        )
+    }) + "\n"
+
+
+def _run_full_disk_scan(
+    scan_id: UUID,
+    cid: UUID,
+    devices: List[Device],
+    scan_multiplier: int,
+    scan_start: float
+) -> FullDiskScanResult:
+    """Simulate a full disk scan across devices and build the complete result."""
+    
+    detailed_results = []
+    total_files = 0
+    total_issues = 0
+    total_disk_usage = 0.0
+    total_security_alerts = 0
+    non_compliant_devices = 0
+    
+    files_per_device = _draw_files_scanned(scan_multiplier, len(devices))
+    for device, device_files in zip(devices, files_per_device):
+        device_result, device_disk_gb = _simulate_device_disk_scan(device, device_files)
+        
+        detailed_results.append(device_result)
+        total_files += device_result["files_scanned"]
+        total_issues += device_result["issues_found"]
+        total_disk_usage += device_disk_gb
+        total_security_alerts += device_result["security_alerts"]
+        if device_result["compliance_status"] == "non_compliant":
+            non_compliant_devices += 1
+    
+    scan_duration = time.perf_counter() - scan_start
+    
+    return FullDiskScanResult(
+        scan_id=scan_id,
+        user_cid=cid,
+        devices_scanned=len(devices),
+        scan_duration_seconds=round(scan_duration, 2),
+        files_scanned=total_files,
+        issues_found=total_issues,
+        disk_usage_gb=round(total_disk_usage, 2),
+        security_alerts=total_security_alerts,
+        scan_summary=_build_disk_scan_summary(
+            len(devices), non_compliant_devices, total_issues, total_security_alerts
+        ),
+        detailed_results=detailed_results
+    )
+
+
+def _disk_scan_cache_key(scan_id: UUID) -> str:
+    """Cache key under which a background disk scan's status and result are kept."""
+    return f"full_disk_scan_{scan_id}"
+
+
+def _run_full_disk_scan_job(scan_id: UUID, cid: UUID, devices: List[Device], scan_multiplier: int):
+    """Background task: run a full disk scan and store the outcome for polling."""
+    
+    cache_key = _disk_scan_cache_key(scan_id)
+    try:
+        result = _run_full_disk_scan(scan_id, cid, devices, scan_multiplier, time.perf_counter())
+        entry = {"scan_id": str(scan_id), "status": "completed", "result": result}
+    except Exception as e:
+        entry = {"scan_id": str(scan_id), "status": "failed", "result": None, "error_message": str(e)}
+    app_cache.set(cache_key, entry, ttl_seconds=DISK_SCAN_RESULT_TTL_SECONDS)
+
+
 @router.post("/full-disk-scan/{cid}", response_model=FullDiskScanResult)
 def full_disk_scan(
     cid: UUID,
     scan_request: FullDiskScanRequest,
+    background_tasks: BackgroundTasks,
+    stream: bool = Query(False, description="Stream per-device results as NDJSON instead of one JSON body"),
+    run_in_background: bool = Query(False, description="Queue the scan and return 202 with a scan_id to poll"),
     db: Session = Depends(get_db),
     _: str = Depends(verify_token)
 ):
@@ -362,10 +659,14 @@ def full_disk_scan(
     - Configurable scan depth (quick, standard, deep)
     - Returns detailed results per device with security alerts
     - Use for thorough security audits and compliance checks
+    - Pass stream=true to receive NDJSON: one line per device, then a summary line
+    - Pass run_in_background=true to get 202 + scan_id, then poll GET /users/full-disk-scan/{scan_id}
     
     Args:
         cid: User's canonical identity
         scan_request: Scan configuration parameters
+        stream: Stream per-device results as NDJSON
+        run_in_background: Queue the scan and return immediately with 202 Accepted
     
     Returns:
         Detailed scan results with security and compliance findings
@@ -375,90 +676,52 @@ def full_disk_scan(
         400: Invalid scan parameters
     """
     
-    user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == cid).first()
-    if not user:
+    if not _user_exists(db, cid):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with CID {cid} not found"
         )
     
-    # Get user's devices
-    devices = db.query(Device).filter(Device.owner_cid == cid).all()
+    # Only the device id and name are reported by the scan
+    device_query = db.query(Device.id, Device.name).filter(Device.owner_cid == cid)
     
     try:
-        import time
-        import uuid
         
-        scan_start = time.time()
+        scan_start = time.perf_counter()
         scan_id = uuid.uuid4()
+        scan_multiplier = _SCAN_DEPTH_MULTIPLIERS.get(scan_request.scan_depth, 5000)
+        
+        # Flush per-device results as they are produced instead of holding them all
+        if stream:
+            return StreamingResponse(
+                _stream_full_disk_scan(
+                    scan_id, cid, device_query.yield_per(DISK_SCAN_BATCH_SIZE), scan_multiplier, scan_start
+                ),
+                media_type="application/x-ndjson"
+            )
         
-        # Simulate comprehensive disk scan
-        detailed_results = []
-        total_files = 0
-        total_issues = 0
-        total_disk_usage = 0.0
-        total_security_alerts = 0
-        
-        for device in devices:
-            # Simulate device-specific scan based on scan depth
-            scan_multiplier = {
-                'quick': 1000,
-                'standard': 5000,
-                'deep': 15000
-            }.get(scan_request.scan_depth, 5000)
-            
-            device_files = random.randint(scan_multiplier, scan_multiplier * 2)
-            device_issues = random.randint(0, max(1, device_files // 1000))
-            device_disk_gb = random.uniform(50.0, 500.0)
-            device_alerts = random.randint(0, max(1, device_issues // 2))
-            
-            device_result = {
-                "device_id": str(device.id),
-                "device_name": device.name,
-                "files_scanned": device_files,
-                "issues_found": device_issues,
-                "disk_usage_gb": round(device_disk_gb, 2),
-                "security_alerts": device_alerts,
-                "scan_duration_seconds": round(random.uniform(30.0, 300.0), 2),
-                "compliance_status": "compliant" if device_issues < 3 else "non_compliant",
-                "top_issues": [
-                    f"Unauthorized file access in /tmp",
-                    f"Outdated security certificates",
-                    f"Suspicious network connections"
-                ][:device_alerts] if device_alerts > 0 else []
-            }
-            
-            detailed_results.append(device_result)
-            total_files += device_files
-            total_issues += device_issues
-            total_disk_usage += device_disk_gb
-            total_security_alerts += device_alerts
-        
-        scan_duration = time.time() - scan_start
+        devices = device_query.all()
         
-        # Generate summary based on results
-        compliance_rate = (len(devices) - sum(1 for r in detailed_results if r["compliance_status"] == "non_compliant")) / len(devices) * 100 if devices else 100
+        # Hand the scan to a background task and let the client poll for the result
+        if run_in_background:
+            app_cache.set(
+                _disk_scan_cache_key(scan_id),
+                {"scan_id": str(scan_id), "status": "queued", "result": None},
+                ttl_seconds=DISK_SCAN_RESULT_TTL_SECONDS
+            )
+            background_tasks.add_task(
+                _run_full_disk_scan_job, scan_id, cid, devices, scan_multiplier
+            )
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content={
+                    "scan_id": str(scan_id),
+                    "status": "queued",
+                    "status_url": f"/v1/users/full-disk-scan/{scan_id}"
+                }
+            )
         
-        scan_summary = f"Full disk scan completed for {len(devices)} devices. "
-        scan_summary += f"Compliance rate: {compliance_rate:.1f}%. "
-        scan_summary += f"Found {total_issues} issues requiring attention. "
-        if total_security_alerts > 0:
-            scan_summary += f"{total_security_alerts} security alerts detected."
-        else:
-            scan_summary += "No critical security alerts."
-        
-        return FullDiskScanResult(
-            scan_id=scan_id,
-            user_cid=cid,
-            devices_scanned=len(devices),
-            scan_duration_seconds=round(scan_duration, 2),
-            files_scanned=total_files,
-            issues_found=total_issues,
-            disk_usage_gb=round(total_disk_usage, 2),
-            security_alerts=total_security_alerts,
-            scan_summary=scan_summary,
-            detailed_results=detailed_results
-        )
+        return _run_full_disk_scan(scan_id, cid, devices, scan_multiplier, scan_start)
         
     except Exception as e:
         raise HTTPException(
@@ -467,6 +730,37 @@ def full_disk_scan(
         )
 
 
+@router.get("/full-disk-scan/{scan_id}")
+def get_full_disk_scan_status(
+    scan_id: UUID,
+    _: str = Depends(verify_token)
+):
+    """
+    Get the status and result of a background full disk scan.
+    
+    **Frontend Integration Notes:**
+    - Poll after starting a scan with run_in_background=true
+    - status is queued, completed or failed; result is set once completed
+    - Results are kept for one hour
+    
+    Args:
+        scan_id: Scan identifier returned by the 202 response
+    
+    Returns:
+        Scan status with the full scan result when completed
+        
+    Raises:
+        404: Unknown or expired scan
+    """
+    entry = app_cache.get(_disk_scan_cache_key(scan_id))
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Full disk scan {scan_id} not found or expired"
+        )
+    return entry
+
+
 @router.post("/force-checkin/{cid}", response_model=ForceCheckinResult)
 def force_user_checkin(
     cid: UUID,
@@ -494,7 +788,9 @@ def force_user_checkin(
         404: User not found
     """
     
-    user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == cid).first()
+    user = db.query(CanonicalIdentity.cid, CanonicalIdentity.full_name).filter(
+        CanonicalIdentity.cid == cid
+    ).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -511,35 +807,48 @@ def force_user_checkin(
         devices = db.query(Device).filter(Device.owner_cid == cid).all()
     
     try:
-        import time
-        from datetime import datetime, timedelta
         
         devices_contacted = len(devices)
         devices_responded = 0
         compliance_scans_completed = 0
         devices_updated = []
+        compliant_ids = []
+        non_compliant_ids = []
         
         for device in devices:
             # Simulate force check-in (90% success rate)
             if random.random() < 0.9:
                 devices_responded += 1
                 
-                # Update device last_check_in time
-                device.last_check_in = datetime.utcnow()
-                
-                # Update last_seen if device responded
-                device.last_seen = datetime.utcnow()
-                
                 # Optionally run compliance scan
                 if checkin_request.compliance_scan:
                     # Simulate compliance scan (80% success rate)
                     if random.random() < 0.8:
                         compliance_scans_completed += 1
                         # Randomly update compliance status
-                        device.compliant = random.random() < 0.85
+                        if random.random() < 0.85:
+                            compliant_ids.append(device.id)
+                        else:
+                            non_compliant_ids.append(device.id)
                 
                 devices_updated.append(device.id)
         
+        # Apply the check-in and compliance results with one UPDATE per value set
+        if devices_updated:
+            now = datetime.utcnow()
+            db.query(Device).filter(Device.id.in_(devices_updated)).update(
+                {Device.last_check_in: now, Device.last_seen: now},
+                synchronize_session=False
+            )
+        if compliant_ids:
+            db.query(Device).filter(Device.id.in_(compliant_ids)).update(
+                {Device.compliant: True}, synchronize_session=False
+            )
+        if non_compliant_ids:
+            db.query(Device).filter(Device.id.in_(non_compliant_ids)).update(
+                {Device.compliant: False}, synchronize_session=False
+            )
+        
         db.commit()
         
         success_rate = (devices_responded / devices_contacted * 100) if devices_contacted > 0 else 0
@@ -591,14 +900,16 @@ def bulk_user_operations(
     """
     
     try:
-        import uuid
-        import time
         
         operation_id = uuid.uuid4()
-        operation_start = time.time()
+        operation_start = time.perf_counter()
         
-        # Validate that all users exist
-        users = db.query(CanonicalIdentity).filter(
+        # Validate that all users exist, fetching only the columns the results need
+        users = db.query(
+            CanonicalIdentity.cid,
+            CanonicalIdentity.email,
+            CanonicalIdentity.full_name
+        ).filter(
             CanonicalIdentity.cid.in_(operation_request.user_cids)
         ).all()
         
@@ -610,9 +921,16 @@ def bulk_user_operations(
                 detail=f"Users not found: {list(missing_cids)}"
             )
         
+        # Load devices for every selected user in one query, grouped by owner
+        devices_by_owner = defaultdict(list)
+        if operation_request.operation_type != "reset_password":
+            for device in db.query(Device).filter(Device.owner_cid.in_(operation_request.user_cids)).all():
+                devices_by_owner[device.owner_cid].append(device)
+        
         results = []
         successful_operations = 0
         failed_operations = 0
+        checked_in_device_ids = []
         
         for user in users:
             try:
@@ -627,7 +945,7 @@ def bulk_user_operations(
                 
                 if operation_request.operation_type == "scan":
                     # Simulate quick compliance scan
-                    devices = db.query(Device).filter(Device.owner_cid == user.cid).all()
+                    devices = devices_by_owner.get(user.cid, [])
                     issues_found = random.randint(0, len(devices))
                     user_result["operation_details"] = {
                         "devices_scanned": len(devices),
@@ -645,8 +963,9 @@ def bulk_user_operations(
                     
                 elif operation_request.operation_type == "force_checkin":
                     # Simulate force check-in
-                    devices = db.query(Device).filter(Device.owner_cid == user.cid).all()
+                    devices = devices_by_owner.get(user.cid, [])
                     responded = random.randint(0, len(devices))
+                    checked_in_device_ids.extend(device.id for device in random.sample(devices, responded))
                     user_result["operation_details"] = {
                         "devices_contacted": len(devices),
                         "devices_responded": responded,
@@ -655,8 +974,8 @@ def bulk_user_operations(
                     
                 elif operation_request.operation_type == "full_disk_scan":
                     # Simulate full disk scan
-                    devices = db.query(Device).filter(Device.owner_cid == user.cid).all()
-                    total_files = sum(random.randint(1000, 10000) for _ in devices)
+                    devices = devices_by_owner.get(user.cid, [])
+                    total_files = sum(random.choices(range(1000, 10001), k=len(devices)))
                     total_issues = random.randint(0, total_files // 1000)
                     user_result["operation_details"] = {
                         "devices_scanned": len(devices),
@@ -680,13 +999,24 @@ def bulk_user_operations(
                 }
                 results.append(user_result)
         
-        operation_duration = time.time() - operation_start
+        # Write every user's check-ins in one UPDATE and commit the batch once
+        if checked_in_device_ids:
+            now = datetime.utcnow()
+            db.query(Device).filter(Device.id.in_(checked_in_device_ids)).update(
+                {Device.last_check_in: now, Device.last_seen: now},
+                synchronize_session=False
+            )
+            db.commit()
+        
+        operation_duration = time.perf_counter() - operation_start
         total_users = len(operation_request.user_cids)
         success_rate = (successful_operations / total_users * 100) if total_users > 0 else 0
         
-        summary = f"Bulk {operation_request.operation_type} operation completed. "
-        summary += f"Processed {total_users} users in {operation_duration:.1f} seconds. "
-        summary += f"Success rate: {success_rate:.1f}% ({successful_operations} successful, {failed_operations} failed)."
+        summary = (
+            f"Bulk {operation_request.operation_type} operation completed. "
+            f"Processed {total_users} users in {operation_duration:.1f} seconds. "
+            f"Success rate: {success_rate:.1f}% ({successful_operations} successful, {failed_operations} failed)."
+        )
         
         return BulkUserOperationResult(
             operation_id=operation_id,
@@ -699,6 +1029,7 @@ def bulk_user_operations(
         )
         
     except Exception as e:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Bulk operation failed: {str(e)}"
@@ -732,7 +1063,7 @@ def assign_devices_to_user(
     """
     
     # Validate target user exists
-    target_user = db.query(CanonicalIdentity).filter(
+    target_user = db.query(CanonicalIdentity.cid, CanonicalIdentity.full_name).filter(
         CanonicalIdentity.cid == assignment_request.target_user_cid
     ).first()
     if not target_user:
@@ -741,8 +1072,12 @@ def assign_devices_to_user(
             detail=f"Target user with CID {assignment_request.target_user_cid} not found"
         )
     
-    # Get devices to assign
-    devices = db.query(Device).filter(Device.id.in_(assignment_request.device_ids)).all()
+    # Get devices to assign, loading only the columns the assignment reads
+    devices = []
+    for device_ids_chunk in chunked(assignment_request.device_ids, DEVICE_ID_CHUNK_SIZE):
+        devices.extend(db.query(Device).options(
+            load_only(Device.id, Device.name, Device.owner_cid)
+        ).filter(Device.id.in_(device_ids_chunk)).all())
     if len(devices) != len(assignment_request.device_ids):
         found_device_ids = {device.id for device in devices}
         missing_device_ids = set(assignment_request.device_ids) - found_device_ids
@@ -752,23 +1087,27 @@ def assign_devices_to_user(
         )
     
     try:
-        import uuid
-        from datetime import datetime
         
         assignment_id = uuid.uuid4()
         devices_assigned = 0
         devices_failed = 0
         assignment_details = []
+        assigned_device_ids = []
+        history_device_ids = []
+        pending_logs = []
+        # Stringify the target once rather than for every device
+        target_user_cid_str = str(assignment_request.target_user_cid)
         
         for device in devices:
             device_result = {
                 "device_id": str(device.id),
                 "device_name": device.name,
                 "previous_owner_cid": str(device.owner_cid) if device.owner_cid else None,
-                "new_owner_cid": str(assignment_request.target_user_cid),
+                "new_owner_cid": target_user_cid_str,
                 "status": "success",
                 "error_message": None
             }
+            assignment_details.append(device_result)
             
             try:
                 # Check if device is already assigned and handle force reassign
@@ -776,22 +1115,17 @@ def assign_devices_to_user(
                     device_result["status"] = "failed"
                     device_result["error_message"] = f"Device already assigned to user {device.owner_cid}"
                     devices_failed += 1
-                    assignment_details.append(device_result)
                     continue
                 
                 # Store old owner for logging
                 old_owner_cid = device.owner_cid
                 
-                # Assign device to new user
-                device.owner_cid = assignment_request.target_user_cid
+                # Queue device for the bulk owner update below
+                assigned_device_ids.append(device.id)
                 
                 # Transfer activity history if requested
                 if assignment_request.transfer_activity_history and old_owner_cid:
-                    activity_records = db.query(ActivityHistory).filter(
-                        ActivityHistory.device_id == device.id
-                    ).all()
-                    for activity in activity_records:
-                        activity.user_cid = assignment_request.target_user_cid
+                    history_device_ids.append(device.id)
                 
                 # Log configuration change
                 log_user_config_change(
@@ -801,24 +1135,43 @@ def assign_devices_to_user(
                     change_type=ConfigChangeTypeEnum.UPDATED,
                     field_name="owner_assignment",
                     old_value=str(old_owner_cid) if old_owner_cid else "unassigned",
-                    new_value=str(assignment_request.target_user_cid),
-                    changed_by="API User"
+                    new_value=target_user_cid_str,
+                    changed_by="API User",
+                    pending_logs=pending_logs
                 )
                 
                 devices_assigned += 1
-                assignment_details.append(device_result)
                 
             except Exception as device_error:
                 device_result["status"] = "failed"
                 device_result["error_message"] = str(device_error)
                 devices_failed += 1
-                assignment_details.append(device_result)
         
+        # Assign all accepted devices to the new user, one UPDATE per chunk
+        for device_ids_chunk in chunked(assigned_device_ids, DEVICE_ID_CHUNK_SIZE):
+            db.query(Device).filter(Device.id.in_(device_ids_chunk)).update(
+                {Device.owner_cid: assignment_request.target_user_cid},
+                synchronize_session=False
+            )
+        
+        # Re-attribute activity history of previously owned devices, one UPDATE per chunk
+        for device_ids_chunk in chunked(history_device_ids, DEVICE_ID_CHUNK_SIZE):
+            db.query(ActivityHistory).filter(
+                ActivityHistory.device_id.in_(device_ids_chunk)
+            ).update(
+                {ActivityHistory.user_cid: assignment_request.target_user_cid},
+                synchronize_session=False
+            )
+        
+        flush_user_config_changes(db, pending_logs)
         db.commit()
+        app_cache.delete(USERS_SUMMARY_CACHE_KEY)
         
         success_rate = (devices_assigned / len(devices) * 100) if devices else 0
-        summary = f"Device assignment completed for user {target_user.full_name}. "
-        summary += f"Assigned {devices_assigned} of {len(devices)} devices ({success_rate:.1f}% success rate)."
+        summary = (
+            f"Device assignment completed for user {target_user.full_name}. "
+            f"Assigned {devices_assigned} of {len(devices)} devices ({success_rate:.1f}% success rate)."
+        )
         
         return DeviceAssignmentResult(
             assignment_id=assignment_id,
@@ -863,19 +1216,20 @@ def transfer_device_ownership(
         400: Invalid transfer parameters
     """
     
-    # Validate source and target users exist
-    source_user = db.query(CanonicalIdentity).filter(
-        CanonicalIdentity.cid == transfer_request.source_user_cid
-    ).first()
+    # Validate source and target users exist, fetching both in one query
+    users_by_cid = {
+        user.cid: user for user in db.query(CanonicalIdentity.cid, CanonicalIdentity.full_name).filter(
+            CanonicalIdentity.cid.in_([transfer_request.source_user_cid, transfer_request.target_user_cid])
+        ).all()
+    }
+    source_user = users_by_cid.get(transfer_request.source_user_cid)
     if not source_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Source user with CID {transfer_request.source_user_cid} not found"
         )
     
-    target_user = db.query(CanonicalIdentity).filter(
-        CanonicalIdentity.cid == transfer_request.target_user_cid
-    ).first()
+    target_user = users_by_cid.get(transfer_request.target_user_cid)
     if not target_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -883,10 +1237,12 @@ def transfer_device_ownership(
         )
     
     # Get devices to transfer (must belong to source user)
-    devices = db.query(Device).filter(
-        Device.id.in_(transfer_request.device_ids),
-        Device.owner_cid == transfer_request.source_user_cid
-    ).all()
+    devices = []
+    for device_ids_chunk in chunked(transfer_request.device_ids, DEVICE_ID_CHUNK_SIZE):
+        devices.extend(db.query(Device).filter(
+            Device.id.in_(device_ids_chunk),
+            Device.owner_cid == transfer_request.source_user_cid
+        ).all())
     
     if len(devices) != len(transfer_request.device_ids):
         found_device_ids = {device.id for device in devices}
@@ -897,35 +1253,31 @@ def transfer_device_ownership(
         )
     
     try:
-        import uuid
-        from datetime import datetime
         
         transfer_id = uuid.uuid4()
         devices_transferred = 0
         devices_failed = 0
         transfer_details = []
+        transferred_device_ids = []
+        pending_logs = []
+        # Stringify both users once rather than for every device
+        source_user_cid_str = str(transfer_request.source_user_cid)
+        target_user_cid_str = str(transfer_request.target_user_cid)
         
         for device in devices:
             device_result = {
                 "device_id": str(device.id),
                 "device_name": device.name,
-                "source_user_cid": str(transfer_request.source_user_cid),
-                "target_user_cid": str(transfer_request.target_user_cid),
+                "source_user_cid": source_user_cid_str,
+                "target_user_cid": target_user_cid_str,
                 "status": "success",
                 "error_message": None
             }
+            transfer_details.append(device_result)
             
             try:
-                # Transfer device ownership
-                device.owner_cid = transfer_request.target_user_cid
-                
-                # Transfer activity history if requested
-                if transfer_request.transfer_activity_history:
-                    activity_records = db.query(ActivityHistory).filter(
-                        ActivityHistory.device_id == device.id
-                    ).all()
-                    for activity in activity_records:
-                        activity.user_cid = transfer_request.target_user_cid
+                # Queue device for the bulk ownership transfer below
+                transferred_device_ids.append(device.id)
                 
                 # Log configuration change
                 log_user_config_change(
@@ -934,25 +1286,44 @@ def transfer_device_ownership(
                     entity_id=device.id,
                     change_type=ConfigChangeTypeEnum.UPDATED,
                     field_name="owner_transfer",
-                    old_value=str(transfer_request.source_user_cid),
-                    new_value=str(transfer_request.target_user_cid),
-                    changed_by="API User"
+                    old_value=source_user_cid_str,
+                    new_value=target_user_cid_str,
+                    changed_by="API User",
+                    pending_logs=pending_logs
                 )
                 
                 devices_transferred += 1
-                transfer_details.append(device_result)
                 
             except Exception as device_error:
                 device_result["status"] = "failed"
                 device_result["error_message"] = str(device_error)
                 devices_failed += 1
-                transfer_details.append(device_result)
         
+        # Transfer ownership of all accepted devices, one UPDATE per chunk
+        for device_ids_chunk in chunked(transferred_device_ids, DEVICE_ID_CHUNK_SIZE):
+            db.query(Device).filter(Device.id.in_(device_ids_chunk)).update(
+                {Device.owner_cid: transfer_request.target_user_cid},
+                synchronize_session=False
+            )
+            
+            # Transfer activity history if requested
+            if transfer_request.transfer_activity_history:
+                db.query(ActivityHistory).filter(
+                    ActivityHistory.device_id.in_(device_ids_chunk)
+                ).update(
+                    {ActivityHistory.user_cid: transfer_request.target_user_cid},
+                    synchronize_session=False
+                )
+        
+        flush_user_config_changes(db, pending_logs)
         db.commit()
+        app_cache.delete(USERS_SUMMARY_CACHE_KEY)
         
         success_rate = (devices_transferred / len(devices) * 100) if devices else 0
-        summary = f"Device transfer completed from {source_user.full_name} to {target_user.full_name}. "
-        summary += f"Transferred {devices_transferred} of {len(devices)} devices ({success_rate:.1f}% success rate)."
+        summary = (
+            f"Device transfer completed from {source_user.full_name} to {target_user.full_name}. "
+            f"Transferred {devices_transferred} of {len(devices)} devices ({success_rate:.1f}% success rate)."
+        )
         
         return DeviceTransferResult(
             transfer_id=transfer_id,
@@ -998,7 +1369,9 @@ def unassign_devices_from_users(
     """
     
     # Get devices to unassign
-    devices = db.query(Device).filter(Device.id.in_(unassignment_request.device_ids)).all()
+    devices = []
+    for device_ids_chunk in chunked(unassignment_request.device_ids, DEVICE_ID_CHUNK_SIZE):
+        devices.extend(db.query(Device).filter(Device.id.in_(device_ids_chunk)).all())
     if len(devices) != len(unassignment_request.device_ids):
         found_device_ids = {device.id for device in devices}
         missing_device_ids = set(unassignment_request.device_ids) - found_device_ids
@@ -1008,12 +1381,13 @@ def unassign_devices_from_users(
         )
     
     try:
-        import uuid
         
         unassignment_id = uuid.uuid4()
         devices_unassigned = 0
         devices_failed = 0
         unassignment_details = []
+        unassigned_device_ids = []
+        pending_logs = []
         
         for device in devices:
             device_result = {
@@ -1023,12 +1397,13 @@ def unassign_devices_from_users(
                 "status": "success",
                 "error_message": None
             }
+            unassignment_details.append(device_result)
             
             try:
                 old_owner_cid = device.owner_cid
                 
-                # Unassign device
-                device.owner_cid = None
+                # Queue device for the bulk unassignment below
+                unassigned_device_ids.append(device.id)
                 
                 # Log configuration change
                 if old_owner_cid:
@@ -1040,24 +1415,34 @@ def unassign_devices_from_users(
                         field_name="owner_unassignment",
                         old_value=str(old_owner_cid),
                         new_value="unassigned",
-                        changed_by="API User"
+                        changed_by="API User",
+                        pending_logs=pending_logs
                     )
                 
                 devices_unassigned += 1
-                unassignment_details.append(device_result)
                 
             except Exception as device_error:
                 device_result["status"] = "failed"
                 device_result["error_message"] = str(device_error)
                 devices_failed += 1
-                unassignment_details.append(device_result)
         
+        # Clear the owner of all accepted devices, one UPDATE per chunk
+        for device_ids_chunk in chunked(unassigned_device_ids, DEVICE_ID_CHUNK_SIZE):
+            db.query(Device).filter(Device.id.in_(device_ids_chunk)).update(
+                {Device.owner_cid: None},
+                synchronize_session=False
+            )
+        
+        flush_user_config_changes(db, pending_logs)
         db.commit()
+        app_cache.delete(USERS_SUMMARY_CACHE_KEY)
         
         success_rate = (devices_unassigned / len(devices) * 100) if devices else 0
-        summary = f"Device unassignment completed. "
-        summary += f"Unassigned {devices_unassigned} of {len(devices)} devices ({success_rate:.1f}% success rate). "
-        summary += f"Reason: {unassignment_request.reason}"
+        summary = (
+            "Device unassignment completed. "
+            f"Unassigned {devices_unassigned} of {len(devices)} devices ({success_rate:.1f}% success rate). "
+            f"Reason: {unassignment_request.reason}"
+        )
         
         return DeviceUnassignmentResult(
             unassignment_id=unassignment_id,
@@ -1075,6 +1460,16 @@ def unassign_devices_from_users(
         )
 
 
+def _parse_uuid(value) -> Optional[UUID]:
+    """Parse a UUID from a raw request value, returning None if it is not one."""
+    if isinstance(value, UUID):
+        return value
+    try:
+        return UUID(str(value))
+    except ValueError:
+        return None
+
+
 @router.post("/bulk-device-management", response_model=BulkDeviceManagementResult)
 def bulk_device_management(
     bulk_request: BulkDeviceManagementRequest,
@@ -1089,6 +1484,9 @@ def bulk_device_management(
     - Supports: assign, transfer, unassign operations
     - Returns detailed results per operation with success/failure status
     - Use for large-scale device management tasks
+    - assign only takes devices that have no owner unless the operation sets force_reassign
+    - Each operation reports how many devices it actually changed; one that matches
+      no devices is reported as failed
     
     Args:
         bulk_request: Bulk device management configuration
@@ -1101,17 +1499,51 @@ def bulk_device_management(
     """
     
     try:
-        import uuid
-        import time
         
         bulk_operation_id = uuid.uuid4()
-        operation_start = time.time()
+        operation_start = time.perf_counter()
         
         successful_operations = 0
         failed_operations = 0
         operation_results = []
+        pending_logs = []
+        devices_changed = 0
+        
+        # Parse every operation's device IDs up front so all devices are read at once
+        operation_device_ids = [
+            [_parse_uuid(device_id) for device_id in operation.get("device_ids", [])]
+            for operation in bulk_request.operations
+        ]
+        
+        # Current owner of every referenced device, locked so that the owner
+        # filters on the UPDATEs below and the audit entries see the same rows
+        device_owners = {}
+        referenced_device_ids = list({
+            device_id for device_ids in operation_device_ids for device_id in device_ids
+        } - {None})
+        for device_ids_chunk in chunked(referenced_device_ids, DEVICE_ID_CHUNK_SIZE):
+            device_owners.update(
+                db.query(Device.id, Device.owner_cid).filter(
+                    Device.id.in_(device_ids_chunk)
+                ).with_for_update().all()
+            )
         
-        for i, operation in enumerate(bulk_request.operations):
+        # Resolve every source and target user in one query instead of one per operation
+        user_names = {}
+        if bulk_request.operation_type in ("assign", "transfer"):
+            user_cids = {
+                _parse_uuid(operation.get(user_key))
+                for operation in bulk_request.operations
+                for user_key in ("source_user_cid", "target_user_cid")
+            } - {None}
+            if user_cids:
+                user_names = dict(
+                    db.query(CanonicalIdentity.cid, CanonicalIdentity.full_name).filter(
+                        CanonicalIdentity.cid.in_(user_cids)
+                    ).all()
+                )
+        
+        for i, (operation, parsed_device_ids) in enumerate(zip(bulk_request.operations, operation_device_ids)):
             operation_result = {
                 "operation_index": i,
                 "operation_type": bulk_request.operation_type,
@@ -1119,67 +1551,138 @@ def bulk_device_management(
                 "details": {},
                 "error_message": None
             }
+            operation_results.append(operation_result)
             
             try:
+                device_ids = operation.get("device_ids", [])
+                if None in parsed_device_ids:
+                    raise ValueError("device_ids must be valid UUIDs")
+                unique_device_ids = list(dict.fromkeys(parsed_device_ids))
+                missing_device_ids = [
+                    str(device_id) for device_id in unique_device_ids if device_id not in device_owners
+                ]
+                if missing_device_ids:
+                    raise ValueError(f"Devices not found: {missing_device_ids}")
+                
                 if bulk_request.operation_type == "assign":
-                    # Simulate device assignment
-                    device_ids = operation.get("device_ids", [])
                     target_user_cid = operation.get("target_user_cid")
                     
                     # Validate target user exists
-                    target_user = db.query(CanonicalIdentity).filter(
-                        CanonicalIdentity.cid == target_user_cid
-                    ).first()
-                    if not target_user:
+                    new_owner_cid = _parse_uuid(target_user_cid)
+                    if new_owner_cid not in user_names:
                         raise ValueError(f"Target user {target_user_cid} not found")
                     
+                    # Devices owned by someone else are only taken with force_reassign
+                    if operation.get("force_reassign", False):
+                        owner_filter = None
+                    else:
+                        owner_filter = Device.owner_cid.is_(None)
+                    field_name = "owner_assignment"
+                    count_key = "devices_assigned"
                     operation_result["details"] = {
                         "device_ids": device_ids,
                         "target_user_cid": target_user_cid,
-                        "target_user_name": target_user.full_name,
-                        "devices_assigned": len(device_ids)
+                        "target_user_name": user_names[new_owner_cid]
                     }
                     
                 elif bulk_request.operation_type == "transfer":
-                    # Simulate device transfer
-                    device_ids = operation.get("device_ids", [])
                     source_user_cid = operation.get("source_user_cid")
                     target_user_cid = operation.get("target_user_cid")
                     
+                    # Validate both users exist
+                    source_user_cid_key = _parse_uuid(source_user_cid)
+                    if source_user_cid_key not in user_names:
+                        raise ValueError(f"Source user {source_user_cid} not found")
+                    new_owner_cid = _parse_uuid(target_user_cid)
+                    if new_owner_cid not in user_names:
+                        raise ValueError(f"Target user {target_user_cid} not found")
+                    
+                    # Transfers only move devices still owned by the source user
+                    owner_filter = Device.owner_cid == source_user_cid_key
+                    field_name = "owner_transfer"
+                    count_key = "devices_transferred"
                     operation_result["details"] = {
                         "device_ids": device_ids,
                         "source_user_cid": source_user_cid,
-                        "target_user_cid": target_user_cid,
-                        "devices_transferred": len(device_ids)
+                        "target_user_cid": target_user_cid
                     }
                     
                 elif bulk_request.operation_type == "unassign":
-                    # Simulate device unassignment
-                    device_ids = operation.get("device_ids", [])
                     reason = operation.get("reason", "Bulk unassignment")
                     
+                    # Devices without an owner are left as they are
+                    new_owner_cid = None
+                    owner_filter = Device.owner_cid.isnot(None)
+                    field_name = "owner_unassignment"
+                    count_key = "devices_unassigned"
                     operation_result["details"] = {
                         "device_ids": device_ids,
-                        "reason": reason,
-                        "devices_unassigned": len(device_ids)
+                        "reason": reason
                     }
                 
+                # Apply the owner change, one UPDATE per chunk of device IDs
+                devices_updated = 0
+                for device_ids_chunk in chunked(unique_device_ids, DEVICE_ID_CHUNK_SIZE):
+                    device_query = db.query(Device).filter(Device.id.in_(device_ids_chunk))
+                    if owner_filter is not None:
+                        device_query = device_query.filter(owner_filter)
+                    devices_updated += device_query.update(
+                        {Device.owner_cid: new_owner_cid},
+                        synchronize_session=False
+                    )
+                operation_result["details"][count_key] = devices_updated
+                
+                if not devices_updated:
+                    raise ValueError("No devices matched the operation")
+                
+                # Audit the devices the UPDATE changed; their rows are locked, so the
+                # owners read above are the ones it replaced
+                new_value = str(new_owner_cid) if new_owner_cid else "unassigned"
+                for device_id in unique_device_ids:
+                    old_owner_cid = device_owners[device_id]
+                    if bulk_request.operation_type == "assign":
+                        if old_owner_cid is not None and owner_filter is not None:
+                            continue
+                    elif bulk_request.operation_type == "transfer":
+                        if old_owner_cid != source_user_cid_key:
+                            continue
+                    elif old_owner_cid is None:
+                        continue
+                    log_user_config_change(
+                        db=db,
+                        entity_type="device",
+                        entity_id=device_id,
+                        change_type=ConfigChangeTypeEnum.UPDATED,
+                        field_name=field_name,
+                        old_value=str(old_owner_cid) if old_owner_cid else "unassigned",
+                        new_value=new_value,
+                        changed_by="API User",
+                        pending_logs=pending_logs
+                    )
+                    device_owners[device_id] = new_owner_cid
+                
+                devices_changed += devices_updated
                 successful_operations += 1
-                operation_results.append(operation_result)
                 
             except Exception as operation_error:
                 failed_operations += 1
                 operation_result["status"] = "failed"
                 operation_result["error_message"] = str(operation_error)
-                operation_results.append(operation_result)
         
-        operation_duration = time.time() - operation_start
+        flush_user_config_changes(db, pending_logs)
+        db.commit()
+        if devices_changed:
+            app_cache.delete(USERS_SUMMARY_CACHE_KEY)
+        
+        operation_duration = time.perf_counter() - operation_start
         total_operations = len(bulk_request.operations)
         success_rate = (successful_operations / total_operations * 100) if total_operations > 0 else 0
         
-        summary = f"Bulk {bulk_request.operation_type} operation completed. "
-        summary += f"Processed {total_operations} operations in {operation_duration:.1f} seconds. "
-        summary += f"Success rate: {success_rate:.1f}% ({successful_operations} successful, {failed_operations} failed)."
+        summary = (
+            f"Bulk {bulk_request.operation_type} operation completed. "
+            f"Processed {total_operations} operations in {operation_duration:.1f} seconds. "
+            f"Success rate: {success_rate:.1f}% ({successful_operations} successful, {failed_operations} failed)."
+        )
         
         return BulkDeviceManagementResult(
             bulk_operation_id=bulk_operation_id,
@@ -1192,6 +1695,7 @@ def bulk_device_management(
         )
         
     except Exception as e:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Bulk device management failed: {str(e)}"
@@ -1210,7 +1714,11 @@ def get_user_detail(
     - **cid**: User's canonical identity UUID
     """
     
-    user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == cid).first()
+    # Eager-load related collections so validation doesn't lazy-load them one by one
+    user = db.query(CanonicalIdentity).options(
+        selectinload(CanonicalIdentity.group_memberships),
+        selectinload(CanonicalIdentity.accounts)
+    ).filter(CanonicalIdentity.cid == cid).first()
     
     if not user:
         raise HTTPException(
@@ -1222,11 +1730,7 @@ def get_user_detail(
     devices_with_owner_info = get_devices_with_owner_info(db, cid)
     
     # Transform the user data for response
-    user_data = UserDetailSchema.model_validate(user)
-    user_data.groups = user.group_memberships
-    user_data.devices = [DeviceSchema.model_validate(device) for device in devices_with_owner_info]
-    
-    return user_data
+    return _build_user_detail(user, devices_with_owner_info)
 
 
 @router.post("/scan/{cid}", response_model=ScanResultSchema)
@@ -1241,36 +1745,45 @@ def simulate_compliance_scan(
     - **cid**: User's canonical identity UUID
     """
     
-    user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == cid).first()
-    
-    if not user:
+    if not _user_exists(db, cid):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User with CID {cid} not found"
         )
     
-    devices = db.query(Device).filter(Device.owner_cid == cid).all()
+    # Randomly select one device and flip its compliance status in a single
+    # UPDATE ... RETURNING; the alias keeps the subquery from correlating
+    random_device = aliased(Device)
+    random_device_id = db.query(random_device.id).filter(
+        random_device.owner_cid == cid
+    ).order_by(func.random()).limit(1).scalar_subquery()
+    device_to_scan = db.execute(
+        update(Device)
+        .where(Device.id == random_device_id)
+        .values(compliant=~Device.compliant)
+        .returning(Device.name, Device.compliant)
+        .execution_options(synchronize_session=False)
+    ).first()
     
-    if not devices:
+    # No row means the user has no devices (or they were just reassigned)
+    if device_to_scan is None:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No devices found for user {cid}"
         )
     
-    # Randomly select one device and flip its compliance status
-    device_to_scan = random.choice(devices)
-    original_status = device_to_scan.compliant
-    device_to_scan.compliant = not device_to_scan.compliant
+    devices_scanned = db.query(func.count(Device.id)).filter(Device.owner_cid == cid).scalar()
     
     db.commit()
     
-    compliance_changes = 1 if device_to_scan.compliant != original_status else 0
+    compliance_changes = 1
     status_change = "compliant" if device_to_scan.compliant else "non-compliant"
     
     return ScanResultSchema(
         cid=cid,
         message=f"Compliance scan completed. Device '{device_to_scan.name}' is now {status_change}.",
-        devices_scanned=len(devices),
+        devices_scanned=devices_scanned,
         compliance_changes=compliance_changes
     )
 
@@ -1301,7 +1814,7 @@ def update_user_identity(
         404: User not found
     """
     
-    user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == cid).first()
+    user = db.get(CanonicalIdentity, cid)
     
     if not user:
         raise HTTPException(
@@ -1316,13 +1829,11 @@ def update_user_identity(
             setattr(user, field, value)
     
     db.commit()
+    app_cache.delete(USERS_SUMMARY_CACHE_KEY)
     db.refresh(user)
     
     # Transform the user data for response
-    user_data = UserDetailSchema.model_validate(user)
-    user_data.groups = user.group_memberships
-    
-    return user_data
+    return _build_user_detail(user, get_devices_with_owner_info(db, cid))
 
 
 @router.post("/merge", response_model=IdentityMergeResult)
@@ -1357,13 +1868,14 @@ def merge_user_identities(
             detail="Cannot merge user with themselves"
         )
     
-    # Get both users
-    source_user = db.query(CanonicalIdentity).filter(
-        CanonicalIdentity.cid == merge_request.source_cid
-    ).first()
-    target_user = db.query(CanonicalIdentity).filter(
-        CanonicalIdentity.cid == merge_request.target_cid
-    ).first()
+    # Get both users in one query
+    users_by_cid = {
+        user.cid: user for user in db.query(CanonicalIdentity).filter(
+            CanonicalIdentity.cid.in_([merge_request.source_cid, merge_request.target_cid])
+        ).all()
+    }
+    source_user = users_by_cid.get(merge_request.source_cid)
+    target_user = users_by_cid.get(merge_request.target_cid)
     
     if not source_user:
         raise HTTPException(
@@ -1381,57 +1893,93 @@ def merge_user_identities(
     accounts_transferred = 0
     groups_transferred = 0
     
-    # Transfer devices
+    # Transfer devices in one UPDATE; the rowcount is the number moved
     if merge_request.merge_devices:
-        devices = db.query(Device).filter(Device.owner_cid == merge_request.source_cid).all()
-        for device in devices:
-            device.owner_cid = merge_request.target_cid
-        devices_transferred = len(devices)
+        devices_transferred = db.query(Device).filter(
+            Device.owner_cid == merge_request.source_cid
+        ).update(
+            {Device.owner_cid: merge_request.target_cid},
+            synchronize_session=False
+        )
     
     # Transfer accounts
     if merge_request.merge_accounts:
-        accounts = db.query(Account).filter(Account.cid == merge_request.source_cid).all()
+        accounts = db.query(Account.id, Account.service).filter(
+            Account.cid == merge_request.source_cid
+        ).all()
+        # Services the target already has, fetched once instead of per account
+        existing_services = {
+            service for (service,) in db.query(Account.service).filter(
+                Account.cid == merge_request.target_cid
+            ).all()
+        }
+        account_ids_to_move = []
+        duplicate_account_ids = []
         for account in accounts:
-            # Check if target already has account for this service
-            existing = db.query(Account).filter(
-                Account.cid == merge_request.target_cid,
-                Account.service == account.service
-            ).first()
-            if not existing:
-                account.cid = merge_request.target_cid
-                accounts_transferred += 1
+            if account.service not in existing_services:
+                account_ids_to_move.append(account.id)
+                existing_services.add(account.service)
             else:
-                # Delete duplicate account
-                db.delete(account)
+                duplicate_account_ids.append(account.id)
+        # Delete duplicate accounts in one statement
+        if duplicate_account_ids:
+            db.query(Account).filter(Account.id.in_(duplicate_account_ids)).delete(
+                synchronize_session=False
+            )
+        if account_ids_to_move:
+            db.query(Account).filter(Account.id.in_(account_ids_to_move)).update(
+                {Account.cid: merge_request.target_cid},
+                synchronize_session=False
+            )
+        accounts_transferred = len(account_ids_to_move)
     
     # Transfer group memberships
     if merge_request.merge_groups:
-        groups = db.query(GroupMembership).filter(
+        groups = db.query(GroupMembership.id, GroupMembership.group_name).filter(
             GroupMembership.cid == merge_request.source_cid
         ).all()
+        # Groups the target already belongs to, fetched once instead of per membership
+        existing_groups = {
+            group_name for (group_name,) in db.query(GroupMembership.group_name).filter(
+                GroupMembership.cid == merge_request.target_cid
+            ).all()
+        }
+        group_ids_to_move = []
+        duplicate_group_ids = []
         for group in groups:
-            # Check if target already has this group membership
-            existing = db.query(GroupMembership).filter(
-                GroupMembership.cid == merge_request.target_cid,
-                GroupMembership.group_name == group.group_name
-            ).first()
-            if not existing:
-                group.cid = merge_request.target_cid
-                groups_transferred += 1
+            if group.group_name not in existing_groups:
+                group_ids_to_move.append(group.id)
+                existing_groups.add(group.group_name)
             else:
-                # Delete duplicate group membership
-                db.delete(group)
+                duplicate_group_ids.append(group.id)
+        # Delete duplicate group memberships in one statement
+        if duplicate_group_ids:
+            db.query(GroupMembership).filter(GroupMembership.id.in_(duplicate_group_ids)).delete(
+                synchronize_session=False
+            )
+        if group_ids_to_move:
+            db.query(GroupMembership).filter(GroupMembership.id.in_(group_ids_to_move)).update(
+                {GroupMembership.cid: merge_request.target_cid},
+                synchronize_session=False
+            )
+        groups_transferred = len(group_ids_to_move)
+    
+    # Read the names for the message now: commit expires target_user, and
+    # reading it afterwards would re-SELECT the row
+    source_name = source_user.full_name
+    target_name = target_user.full_name
     
     # Delete the source user
     db.delete(source_user)
     db.commit()
+    app_cache.delete(USERS_SUMMARY_CACHE_KEY)
     
     return IdentityMergeResult(
         merged_cid=merge_request.target_cid,
         devices_transferred=devices_transferred,
         accounts_transferred=accounts_transferred,
         groups_transferred=groups_transferred,
-        message=f"Successfully merged {source_user.full_name} into {target_user.full_name}. "
+        message=f"Successfully merged {source_name} into {target_name}. "
                 f"Transferred {devices_transferred} devices, {accounts_transferred} accounts, "
                 f"and {groups_transferred} group memberships."
     )
@@ -1451,8 +1999,7 @@ def reset_user_password(
     - Systems list can be empty to reset on all connected systems
     """
     # Verify user exists
-    user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == request.user_cid).first()
-    if not user:
+    if not _user_exists(db, request.user_cid):
         raise HTTPException(status_code=404, detail="User not found")
     
     # Simulate password reset across systems
@@ -1499,8 +2046,7 @@ def sync_user_data(
     - Use this to refresh user data from connected APIs
     - Monitor sync_duration for performance optimization
     """
-    import time
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # Simulate sync process
     if not request.systems:
@@ -1529,7 +2075,7 @@ def sync_user_data(
         else:
             errors.append(f"Unknown system: {system}")
     
-    sync_duration = time.time() - start_time
+    sync_duration = time.perf_counter() - start_time
     
     return SyncResult(
         systems_synced=systems_to_sync,
@@ -1555,9 +2101,16 @@ def preview_advanced_merge(
     - Use this to show merge conflicts before executing
     - Review conflicts to guide user through resolution process
     """
-    # Verify both users exist
-    source_user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == request.source_cid).first()
-    target_user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == request.target_cid).first()
+    # Verify both users exist, loading only the columns compared for conflicts
+    users_by_cid = {
+        user.cid: user for user in db.query(CanonicalIdentity).options(
+            load_only(*(getattr(CanonicalIdentity, field_name) for field_name, _action in _CONFLICT_FIELDS))
+        ).filter(
+            CanonicalIdentity.cid.in_([request.source_cid, request.target_cid])
+        ).all()
+    }
+    source_user = users_by_cid.get(request.source_cid)
+    target_user = users_by_cid.get(request.target_cid)
     
     if not source_user:
         raise HTTPException(status_code=404, detail="Source user not found")
@@ -1565,38 +2118,32 @@ def preview_advanced_merge(
         raise HTTPException(status_code=404, detail="Target user not found")
     
     # Analyze conflicts
-    from backend.app.schemas import MergeConflict
-    conflicts = []
-    
-    # Check for field conflicts
-    if source_user.full_name != target_user.full_name:
-        conflicts.append(MergeConflict(
-            field_name="full_name",
-            source_value=source_user.full_name,
-            target_value=target_user.full_name,
-            recommended_action="Use target value (more recent)"
-        ))
-    
-    if source_user.department != target_user.department:
-        conflicts.append(MergeConflict(
-            field_name="department",
-            source_value=source_user.department,
-            target_value=target_user.department,
-            recommended_action="Use target value (current assignment)"
-        ))
-    
-    if source_user.role != target_user.role:
-        conflicts.append(MergeConflict(
-            field_name="role",
-            source_value=source_user.role,
-            target_value=target_user.role,
-            recommended_action="Use target value (current role)"
-        ))
-    
-    # Count items to transfer
-    devices_to_transfer = len(source_user.devices) if request.merge_devices else 0
-    accounts_to_transfer = len(source_user.accounts) if request.merge_accounts else 0
-    groups_to_transfer = len(source_user.group_memberships) if request.merge_groups else 0
+    conflicts = [
+        MergeConflict(
+            field_name=field_name,
+            source_value=getattr(source_user, field_name),
+            target_value=getattr(target_user, field_name),
+            recommended_action=recommended_action
+        )
+        for field_name, recommended_action in _CONFLICT_FIELDS
+        if getattr(source_user, field_name) != getattr(target_user, field_name)
+    ]
+    
+    # Count items to transfer in SQL, all three in a single round trip
+    device_count, account_count, group_count = db.query(
+        db.query(func.count(Device.id)).filter(
+            Device.owner_cid == request.source_cid
+        ).scalar_subquery(),
+        db.query(func.count(Account.id)).filter(
+            Account.cid == request.source_cid
+        ).scalar_subquery(),
+        db.query(func.count(GroupMembership.id)).filter(
+            GroupMembership.cid == request.source_cid
+        ).scalar_subquery()
+    ).one()
+    devices_to_transfer = device_count if request.merge_devices else 0
+    accounts_to_transfer = account_count if request.merge_accounts else 0
+    groups_to_transfer = group_count if request.merge_groups else 0
     
     # Estimate duration based on data size
     estimated_duration = 0.5 + (devices_to_transfer * 0.1) + (accounts_to_transfer * 0.05)
@@ -1612,7 +2159,57 @@ def preview_advanced_merge(
     )
 
 
-@router.post("/advanced-merge/execute")
+def _source_identity_value(db: Session, source_cid: UUID, field_name: str):
+    """
+    Scalar subquery reading one column of the source identity.
+    
+    Selects from an alias so it does not correlate with an UPDATE of
+    canonical_identities that embeds it.
+    """
+    source_identity = aliased(CanonicalIdentity)
+    return db.query(getattr(source_identity, field_name)).filter(
+        source_identity.cid == source_cid
+    ).scalar_subquery()
+
+
+def _advanced_merge_result(request: AdvancedMergeRequest, items_transferred: dict) -> Response:
+    """Response for an advanced merge, shared by first runs and replays."""
+    result = AdvancedMergeResult.model_construct(
+        message="Advanced merge completed successfully",
+        source_cid=request.source_cid,
+        target_cid=request.target_cid,
+        items_transferred=items_transferred,
+        conflict_resolution_applied=request.conflict_resolution
+    )
+    # pydantic-core writes the UUIDs straight to JSON bytes, skipping
+    # FastAPI's jsonable_encoder pass over the dict
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+def _recorded_merge_counts(db: Session, request: AdvancedMergeRequest, lock: bool = False) -> Optional[dict]:
+    """
+    items_transferred recorded under request.replay_id, or None if there is none.
+    
+    Raises 409 when the replay_id was recorded for a different source/target pair.
+    """
+    query = db.query(
+        MergeOperation.source_cid, MergeOperation.target_cid, MergeOperation.counts
+    ).filter(MergeOperation.replay_id == request.replay_id)
+    if lock:
+        query = query.with_for_update()
+    recorded = query.first()
+    if recorded is None:
+        return None
+    # Rows recorded before source_cid was stored only carry the target
+    if recorded.target_cid != request.target_cid or recorded.source_cid not in (None, request.source_cid):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"replay_id {request.replay_id} was already used for a different merge"
+        )
+    return recorded.counts
+
+
+@router.post("/advanced-merge/execute", response_model=AdvancedMergeResult)
 def execute_advanced_merge(
     request: AdvancedMergeRequest,
     db: Session = Depends(get_db),
@@ -1624,14 +2221,26 @@ def execute_advanced_merge(
     **Frontend Integration Notes:**
     - Call preview endpoint first to show conflicts to user
     - Use this after user confirms conflict resolution strategy
+    - Send a replay_id to make retries safe: repeating a completed merge with
+      the same replay_id returns the original items_transferred without re-running it
+    - Reusing a replay_id for a different source/target pair returns 409
     """
-    # Verify both users exist
-    source_user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == request.source_cid).first()
-    target_user = db.query(CanonicalIdentity).filter(CanonicalIdentity.cid == request.target_cid).first()
+    # A retry of a merge that already completed returns the recorded counts
+    if request.replay_id is not None:
+        recorded_counts = _recorded_merge_counts(db, request, lock=True)
+        if recorded_counts is not None:
+            return _advanced_merge_result(request, recorded_counts)
+    
+    # Verify both users exist with one query that returns only their CIDs
+    existing_cids = {
+        existing_cid for (existing_cid,) in db.query(CanonicalIdentity.cid).filter(
+            CanonicalIdentity.cid.in_([request.source_cid, request.target_cid])
+        ).all()
+    }
     
-    if not source_user:
+    if request.source_cid not in existing_cids:
         raise HTTPException(status_code=404, detail="Source user not found")
-    if not target_user:
+    if request.target_cid not in existing_cids:
         raise HTTPException(status_code=404, detail="Target user not found")
     
     items_transferred = {
@@ -1641,57 +2250,90 @@ def execute_advanced_merge(
     }
     
     try:
-        # Transfer devices
+        # Transfer devices in one UPDATE; the rowcount is the number moved
         if request.merge_devices:
-            for device in source_user.devices:
-                device.owner_cid = request.target_cid
-                items_transferred["devices"] += 1
+            items_transferred["devices"] = db.query(Device).filter(
+                Device.owner_cid == request.source_cid
+            ).update({Device.owner_cid: request.target_cid}, synchronize_session=False)
         
-        # Transfer accounts  
+        # Transfer accounts
         if request.merge_accounts:
-            for account in source_user.accounts:
-                account.user_cid = request.target_cid
-                items_transferred["accounts"] += 1
+            items_transferred["accounts"] = db.query(Account).filter(
+                Account.cid == request.source_cid
+            ).update({Account.cid: request.target_cid}, synchronize_session=False)
         
         # Transfer group memberships
         if request.merge_groups:
-            for membership in source_user.group_memberships:
-                membership.user_cid = request.target_cid
-                items_transferred["groups"] += 1
+            items_transferred["groups"] = db.query(GroupMembership).filter(
+                GroupMembership.cid == request.source_cid
+            ).update({GroupMembership.cid: request.target_cid}, synchronize_session=False)
         
-        # Apply conflict resolution strategy
+        # Work out the target column values for the conflict resolution strategy
+        target_values = {}
         if request.conflict_resolution == "take_source":
-            target_user.full_name = source_user.full_name
-            target_user.department = source_user.department
-            target_user.role = source_user.role
-            target_user.manager = source_user.manager
-            target_user.location = source_user.location
+            # Copy the columns from the source row, without loading it
+            target_values = {
+                getattr(CanonicalIdentity, field_name): _source_identity_value(db, request.source_cid, field_name)
+                for field_name in _MERGE_COPY_FIELDS
+            }
         elif request.conflict_resolution == "merge":
-            # For merge strategy, prefer non-null values
-            if source_user.manager and not target_user.manager:
-                target_user.manager = source_user.manager
-            if source_user.location and not target_user.location:
-                target_user.location = source_user.location
-        # For "take_target", no action needed
+            # For merge strategy, prefer non-null values:
+            # col = COALESCE(NULLIF(col, ''), NULLIF(<source col>, ''), col)
+            target_values = {
+                getattr(CanonicalIdentity, field_name): func.coalesce(
+                    func.nullif(getattr(CanonicalIdentity, field_name), ""),
+                    func.nullif(_source_identity_value(db, request.source_cid, field_name), ""),
+                    getattr(CanonicalIdentity, field_name)
+                )
+                for field_name in _MERGE_FILL_FIELDS
+            }
+        # For "take_target", no target columns change
         
         # Preserve history if requested
         if request.preserve_history:
             # In production, you might copy activity history records
             pass
         
-        # Mark source user as inactive instead of deleting
-        source_user.status = StatusEnum.DISABLED
+        # Mark source user as inactive instead of deleting, and apply the target
+        # values in the same UPDATE: each column is set by a CASE on which row it is
+        identity_updates = {
+            CanonicalIdentity.status: case(
+                (CanonicalIdentity.cid == request.source_cid,
+                 literal(StatusEnum.DISABLED, CanonicalIdentity.status.type)),
+                else_=CanonicalIdentity.status
+            )
+        }
+        for column, value in target_values.items():
+            identity_updates[column] = case(
+                (CanonicalIdentity.cid == request.target_cid, value),
+                else_=column
+            )
+        db.query(CanonicalIdentity).filter(
+            CanonicalIdentity.cid.in_([request.source_cid, request.target_cid])
+        ).update(identity_updates, synchronize_session=False)
+        
+        # Record the result under the replay_id in the same transaction as the merge
+        if request.replay_id is not None:
+            recorded = db.execute(
+                pg_insert(MergeOperation).values(
+                    replay_id=request.replay_id,
+                    source_cid=request.source_cid,
+                    target_cid=request.target_cid,
+                    counts=items_transferred
+                ).on_conflict_do_nothing(index_elements=[MergeOperation.replay_id])
+            ).rowcount
+            if not recorded:
+                # A concurrent retry committed first; discard this run and return its counts
+                db.rollback()
+                return _advanced_merge_result(request, _recorded_merge_counts(db, request))
         
         db.commit()
+        app_cache.delete(USERS_SUMMARY_CACHE_KEY)
         
-        return {
-            "message": "Advanced merge completed successfully",
-            "source_cid": request.source_cid,
-            "target_cid": request.target_cid,
-            "items_transferred": items_transferred,
-            "conflict_resolution_applied": request.conflict_resolution
-        }
+        return _advanced_merge_result(request, items_transferred)
         
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, computed_field, field_serializer, field_validator
+from typing import Annotated, List, Optional, Dict, Any, Set
 from datetime import datetime
 from uuid import UUID
 import re
@@ -12,6 +12,33 @@ from backend.app.db.models import (
     GroupTypeEnum
 )
 
+# MAC address pattern: XX:XX:XX:XX:XX:XX (or dash-separated)
+_MAC_RE = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
+
+# Shared config for schemas read from ORM objects. Their validators and
+# serializers are built on first use rather than at import; the hot ones
+# are built eagerly at the bottom of this module.
+_ORM_MODEL_CONFIG = ConfigDict(from_attributes=True, defer_build=True)
+
+# Read-only response schemas built from DB rows are never mutated after
+# construction, so they are frozen as well
+_ORM_RESPONSE_CONFIG = ConfigDict(from_attributes=True, defer_build=True, frozen=True)
+
+# Response schemas whose enum fields are only ever written out again keep the
+# plain string value rather than the Enum member
+_ORM_ENUM_RESPONSE_CONFIG = ConfigDict(
+    from_attributes=True, defer_build=True, frozen=True, use_enum_values=True
+)
+
+# Read-only response schemas that are only ever built through their from_row
+# constructors, so pydantic never needs attribute access on them
+_ROW_RESPONSE_CONFIG = ConfigDict(defer_build=True, frozen=True)
+
+# Field descriptions shared by every paginated *ListResponse
+_PAGE_DESC = "Current page number (1-based)"
+_PAGE_SIZE_DESC = "Number of items per page"
+_TOTAL_PAGES_DESC = "Total number of pages"
+
 
 class DeviceTagSchema(BaseModel):
     """
@@ -21,7 +48,7 @@ class DeviceTagSchema(BaseModel):
         id: Unique tag identifier
         tag: Tag value (Remote, On-Site, Executive, etc.)
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_MODEL_CONFIG
     
     id: UUID = Field(..., description="Unique tag identifier")
     tag: DeviceTagEnum = Field(..., description="Tag value")
@@ -36,14 +63,14 @@ class OwnerSchema(BaseModel):
         email: Email of the device owner
         department: Department of the device owner
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_MODEL_CONFIG
     
     name: Optional[str] = Field(None, description="Name of the device owner")
     email: Optional[str] = Field(None, description="Email of the device owner")
     department: Optional[str] = Field(None, description="Department of the device owner")
 
 
-class PolicySchema(BaseModel):
+class DevicePolicySchema(BaseModel):
     """
     Policy schema for device/user policy information.
     
@@ -55,7 +82,7 @@ class PolicySchema(BaseModel):
         severity: Policy severity level
         enabled: Whether policy is enabled
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_RESPONSE_CONFIG
     
     id: UUID = Field(..., description="Unique policy identifier")
     name: str = Field(..., description="Policy name")
@@ -87,7 +114,7 @@ class DeviceSchema(BaseModel):
         groups: Groups that the device owner belongs to
         policies: Policy objects that apply to this device/user
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_RESPONSE_CONFIG
     
     id: UUID = Field(..., description="Unique device identifier")
     name: str = Field(..., description="Human-readable device name")
@@ -102,9 +129,9 @@ class DeviceSchema(BaseModel):
     os_version: Optional[str] = Field(None, description="Operating system version")
     last_check_in: datetime = Field(..., description="Last time device checked in")
     status: DeviceStatusEnum = Field(..., description="Connection status")
-    tags: List[DeviceTagSchema] = Field(default=[], description="List of device tags")
-    groups: List[str] = Field(default=[], description="Groups that the device owner belongs to")
-    policies: List[PolicySchema] = Field(default=[], description="Policy objects that apply to this device/user")
+    tags: List[DeviceTagSchema] = Field(default_factory=list, description="List of device tags")
+    groups: List[str] = Field(default_factory=list, description="Groups that the device owner belongs to")
+    policies: List[DevicePolicySchema] = Field(default_factory=list, description="Policy objects that apply to this device/user")
     search_context: Optional[Dict[str, Any]] = Field(None, description="Search context for navigation (query, filters, page)")
     
     @field_validator('ip_address', mode='before')
@@ -114,6 +141,23 @@ class DeviceSchema(BaseModel):
         if value is None:
             return None
         return str(value)
+    
+    @classmethod
+    def from_row(cls, data: dict) -> "DeviceSchema":
+        """
+        Build from a trusted device dict without validation.
+        
+        The dict must carry the fields above with database values (ip_address
+        already a string); owner, tags and policies are given as plain dicts
+        and are constructed into their sub-schemas as-is.
+        """
+        owner = data.get("owner")
+        return cls.model_construct(**{
+            **data,
+            "owner": OwnerSchema.model_construct(**owner) if owner else None,
+            "tags": [DeviceTagSchema.model_construct(**tag) for tag in data.get("tags", [])],
+            "policies": [DevicePolicySchema.model_construct(**policy) for policy in data.get("policies", [])]
+        })
 
 
 class GroupMembershipSchema(BaseModel):
@@ -127,7 +171,7 @@ class GroupMembershipSchema(BaseModel):
         description: Optional description of what this group is for
         source_system: Which system this group came from (Okta, AD, etc.)
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_MODEL_CONFIG
     
     id: UUID = Field(..., description="Unique membership identifier")
     group_name: str = Field(..., description="Name of the group")
@@ -146,7 +190,7 @@ class AccountSchema(BaseModel):
         status: Account status (Active/Disabled)
         user_email: Email associated with this account
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_MODEL_CONFIG
     
     id: UUID = Field(..., description="Unique account identifier")
     service: str = Field(..., description="Service name (e.g., 'Slack', 'AWS')")
@@ -170,7 +214,7 @@ class UserListItemSchema(BaseModel):
         device_count: Number of devices owned by user
         groups_count: Number of group memberships
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ROW_RESPONSE_CONFIG
     
     cid: UUID = Field(..., description="Canonical Identity - unique user identifier")
     email: str = Field(..., description="Primary email address")
@@ -182,6 +226,20 @@ class UserListItemSchema(BaseModel):
     status: StatusEnum = Field(..., description="User status (Active/Disabled)")
     device_count: int = Field(..., description="Number of devices owned by user")
     groups_count: int = Field(..., description="Number of group memberships")
+    
+    @classmethod
+    def from_row(cls, row, device_count: int, groups_count: int) -> "UserListItemSchema":
+        """
+        Build from a trusted database row without validation.
+        
+        The row must carry the identity columns above (e.g. a SQLAlchemy Row
+        selected from canonical_identities); values are used as-is.
+        """
+        return cls.model_construct(
+            **row._asdict(),
+            device_count=device_count,
+            groups_count=groups_count
+        )
 
 
 class UserDetailSchema(BaseModel):
@@ -203,7 +261,7 @@ class UserDetailSchema(BaseModel):
         groups: List of group memberships
         accounts: List of external service accounts
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_MODEL_CONFIG
     
     # Personal info
     cid: UUID = Field(..., description="Canonical Identity - unique user identifier")
@@ -218,9 +276,9 @@ class UserDetailSchema(BaseModel):
     created_at: datetime = Field(..., description="When user record was created")
     
     # Related data
-    devices: List[DeviceSchema] = Field(default=[], description="List of user's devices")
-    groups: List[GroupMembershipSchema] = Field(default=[], description="List of group memberships")
-    accounts: List[AccountSchema] = Field(default=[], description="List of external service accounts")
+    devices: List[DeviceSchema] = Field(default_factory=list, description="List of user's devices")
+    groups: List[GroupMembershipSchema] = Field(default_factory=list, description="List of group memberships")
+    accounts: List[AccountSchema] = Field(default_factory=list, description="List of external service accounts")
 
 
 class UserListResponse(BaseModel):
@@ -236,9 +294,14 @@ class UserListResponse(BaseModel):
     """
     users: List[UserListItemSchema] = Field(..., description="List of users for current page")
     total: int = Field(..., description="Total number of users matching filters")
-    page: int = Field(..., description="Current page number (1-based)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    page: int = Field(..., description=_PAGE_DESC)
+    page_size: int = Field(..., description=_PAGE_SIZE_DESC)
+    
+    @computed_field(description=_TOTAL_PAGES_DESC)
+    @property
+    def total_pages(self) -> int:
+        """Derived from total and page_size so it can never disagree with them."""
+        return -(-self.total // self.page_size) if self.page_size else 0
 
 
 class ScanResultSchema(BaseModel):
@@ -327,9 +390,9 @@ class DeviceTagRequest(BaseModel):
     Request to add or remove device tags.
     
     Attributes:
-        tags: List of tags to set for the device
+        tags: Tags to set for the device (duplicates are dropped)
     """
-    tags: List[DeviceTagEnum] = Field(..., description="List of tags to set for the device")
+    tags: Set[DeviceTagEnum] = Field(..., description="Tags to set for the device (duplicates are dropped)")
 
 
 class DeviceRenameRequest(BaseModel):
@@ -345,15 +408,12 @@ class DeviceRenameRequest(BaseModel):
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate device name format."""
-        if not v or not v.strip():
+        name = v.strip() if v else ''
+        if not name:
             raise ValueError('Device name cannot be empty')
         
-        # Basic validation for device names
-        if len(v.strip()) < 1:
-            raise ValueError('Device name must be at least 1 character')
-        
         # Remove excessive whitespace
-        return v.strip()
+        return name
 
 
 class DeviceVLANRequest(BaseModel):
@@ -369,9 +429,10 @@ class DeviceVLANRequest(BaseModel):
     @classmethod 
     def validate_vlan(cls, v: str) -> str:
         """Validate VLAN format."""
-        if not v or not v.strip():
+        vlan = v.strip() if v else ''
+        if not vlan:
             raise ValueError('VLAN cannot be empty')
-        return v.strip()
+        return vlan
 
 
 class DeviceMergeRequest(BaseModel):
@@ -464,35 +525,32 @@ class DeviceCreateRequest(BaseModel):
         os_version: Operating system version
         status: Connection status
         compliant: Compliance status
-        tags: List of device tags
+        tags: Device tags (duplicates are dropped)
     """
-    name: str = Field(..., description="Device name")
+    name: Annotated[str, StringConstraints(strip_whitespace=True, min_length=3, max_length=100)] = Field(..., description="Device name")
     owner_cid: UUID = Field(..., description="Owner's canonical identity")
     ip_address: Optional[str] = Field(None, description="Device IP address")
     mac_address: Optional[str] = Field(None, description="Device MAC address")
     vlan: Optional[str] = Field(None, description="VLAN identifier")
-    os_version: Optional[str] = Field(None, description="Operating system version")
+    os_version: Optional[Annotated[str, StringConstraints(strip_whitespace=True, max_length=200)]] = Field(None, description="Operating system version")
     status: DeviceStatusEnum = Field(DeviceStatusEnum.UNKNOWN, description="Connection status")
     compliant: bool = Field(True, description="Compliance status")
-    tags: List[DeviceTagEnum] = Field(default=[], description="List of device tags")
-
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v):
-        if not v or len(v.strip()) < 3:
-            raise ValueError('Device name must be at least 3 characters long')
-        if len(v) > 100:
-            raise ValueError('Device name must be less than 100 characters')
-        return v.strip()
+    tags: Set[DeviceTagEnum] = Field(default_factory=set, description="Device tags (duplicates are dropped)")
 
     @field_validator('ip_address')
     @classmethod
     def validate_ip_address(cls, v):
         if v is None:
             return v
+        ip = v.strip()
         try:
-            ipaddress.ip_address(v.strip())
-            return v.strip()
+            # Dotted-decimal input can only be IPv4, so skip the IPv4-then-IPv6
+            # dispatch in ip_address() for the common case
+            if len(ip) <= 15 and ip.count('.') == 3 and ip.isascii() and ip.replace('.', '').isdigit():
+                ipaddress.IPv4Address(ip)
+            else:
+                ipaddress.ip_address(ip)
+            return ip
         except ValueError:
             raise ValueError('Invalid IP address format')
 
@@ -501,20 +559,11 @@ class DeviceCreateRequest(BaseModel):
     def validate_mac_address(cls, v):
         if v is None:
             return v
-        # MAC address pattern: XX:XX:XX:XX:XX:XX
-        mac_pattern = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
-        if not re.match(mac_pattern, v.strip()):
+        mac = v.strip()
+        # Fixed 17-character format, so reject other lengths before matching
+        if len(mac) != 17 or not _MAC_RE.match(mac):
             raise ValueError('Invalid MAC address format (expected XX:XX:XX:XX:XX:XX)')
-        return v.strip().lower()
-
-    @field_validator('os_version')
-    @classmethod
-    def validate_os_version(cls, v):
-        if v is None:
-            return v
-        if len(v.strip()) > 200:
-            raise ValueError('OS version must be less than 200 characters')
-        return v.strip()
+        return mac.lower()
 
 
 class DeviceListResponse(BaseModel):
@@ -530,9 +579,14 @@ class DeviceListResponse(BaseModel):
     """
     devices: List[DeviceSchema] = Field(..., description="List of devices for current page")
     total: int = Field(..., description="Total number of devices matching filters")
-    page: int = Field(..., description="Current page number (1-based)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    page: int = Field(..., description=_PAGE_DESC)
+    page_size: int = Field(..., description=_PAGE_SIZE_DESC)
+    
+    @computed_field(description=_TOTAL_PAGES_DESC)
+    @property
+    def total_pages(self) -> int:
+        """Derived from total and page_size so it can never disagree with them."""
+        return -(-self.total // self.page_size) if self.page_size else 0
 
 
 class IdentityMergeResult(BaseModel):
@@ -570,7 +624,7 @@ class PolicySchema(BaseModel):
         created_by: User who created the policy
         configuration: Policy configuration as JSON string
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_RESPONSE_CONFIG
     
     id: UUID = Field(..., description="Unique policy identifier")
     name: str = Field(..., description="Policy name")
@@ -596,39 +650,26 @@ class PolicyCreateRequest(BaseModel):
         enabled: Whether policy should be enabled
         configuration: Policy configuration as JSON string
     """
-    name: str = Field(..., description="Policy name")
-    description: Optional[str] = Field(None, description="Policy description")
+    name: Annotated[str, StringConstraints(strip_whitespace=True, min_length=3, max_length=200)] = Field(..., description="Policy name")
+    description: Optional[Annotated[str, StringConstraints(strip_whitespace=True, max_length=1000)]] = Field(None, description="Policy description")
     policy_type: PolicyTypeEnum = Field(..., description="Type of policy")
     severity: PolicySeverityEnum = Field(PolicySeverityEnum.MEDIUM, description="Policy severity level")
     enabled: bool = Field(True, description="Whether policy should be enabled")
     configuration: Optional[str] = Field(None, description="Policy configuration as JSON string")
 
-    @field_validator('name')
-    @classmethod
-    def validate_name(cls, v):
-        if not v or len(v.strip()) < 3:
-            raise ValueError('Policy name must be at least 3 characters long')
-        if len(v) > 200:
-            raise ValueError('Policy name must be less than 200 characters')
-        return v.strip()
-
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v):
-        if v is None:
-            return v
-        if len(v.strip()) > 1000:
-            raise ValueError('Policy description must be less than 1000 characters')
-        return v.strip()
-
     @field_validator('configuration')
     @classmethod
     def validate_configuration(cls, v):
         if v is None:
             return v
+        # Configuration is a JSON object or array; fail fast on anything else
+        # before running the parser
+        stripped = v.lstrip()
+        if not stripped or stripped[0] not in '{[':
+            raise ValueError('Configuration must be valid JSON')
         try:
             # Validate that it's valid JSON
-            json.loads(v)
+            json.loads(stripped)
             return v
         except json.JSONDecodeError:
             raise ValueError('Configuration must be valid JSON')
@@ -665,9 +706,9 @@ class PolicyListResponse(BaseModel):
     """
     policies: List[PolicySchema] = Field(..., description="List of policies for current page")
     total: int = Field(..., description="Total number of policies matching filters")
-    page: int = Field(..., description="Current page number (1-based)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    page: int = Field(..., description=_PAGE_DESC)
+    page_size: int = Field(..., description=_PAGE_SIZE_DESC)
+    total_pages: int = Field(..., description=_TOTAL_PAGES_DESC)
 
 
 # Configuration History Schemas
@@ -687,7 +728,7 @@ class ConfigHistorySchema(BaseModel):
         changed_at: When the change was made
         description: Human-readable description of change
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ROW_RESPONSE_CONFIG
     
     id: UUID = Field(..., description="Unique history record identifier")
     entity_type: str = Field(..., description="Type of entity that was changed")
@@ -699,6 +740,15 @@ class ConfigHistorySchema(BaseModel):
     changed_by: Optional[str] = Field(None, description="User who made the change")
     changed_at: datetime = Field(..., description="When the change was made")
     description: Optional[str] = Field(None, description="Human-readable description of change")
+    
+    @classmethod
+    def from_row(cls, record) -> "ConfigHistorySchema":
+        """
+        Build from a trusted ConfigHistory row without validation.
+        
+        Values are read from the matching attributes and used as-is.
+        """
+        return cls.model_construct(**{name: getattr(record, name) for name in cls.model_fields})
 
 
 class ConfigHistoryListResponse(BaseModel):
@@ -714,9 +764,9 @@ class ConfigHistoryListResponse(BaseModel):
     """
     changes: List[ConfigHistorySchema] = Field(..., description="List of configuration changes for current page")
     total: int = Field(..., description="Total number of changes matching filters")
-    page: int = Field(..., description="Current page number (1-based)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    page: int = Field(..., description=_PAGE_DESC)
+    page_size: int = Field(..., description=_PAGE_SIZE_DESC)
+    total_pages: int = Field(..., description=_TOTAL_PAGES_DESC)
 
 
 # Activity History Schemas
@@ -737,7 +787,7 @@ class ActivityHistorySchema(BaseModel):
         activity_metadata: Additional context as JSON string
         risk_score: Risk level assessment
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ROW_RESPONSE_CONFIG
 
     id: UUID = Field(..., description="Unique activity record identifier")
     user_cid: Optional[UUID] = Field(None, description="Canonical ID of the user involved")
@@ -751,6 +801,18 @@ class ActivityHistorySchema(BaseModel):
     activity_metadata: Optional[str] = Field(None, description="Additional context as JSON string")
     risk_score: Optional[str] = Field(None, description="Risk level assessment")
     
+    @classmethod
+    def from_row(cls, record) -> "ActivityHistorySchema":
+        """
+        Build from a trusted ActivityHistory row without validation.
+        
+        Values are read from the matching attributes and used as-is, except
+        source_ip, which comes back from INET as an ipaddress object.
+        """
+        values = {name: getattr(record, name) for name in cls.model_fields}
+        if values["source_ip"] is not None:
+            values["source_ip"] = str(values["source_ip"])
+        return cls.model_construct(**values)
 
 
 class ActivityHistoryListResponse(BaseModel):
@@ -766,9 +828,9 @@ class ActivityHistoryListResponse(BaseModel):
     """
     activities: List[ActivityHistorySchema] = Field(..., description="List of activities for current page")
     total: int = Field(..., description="Total number of activities matching filters")
-    page: int = Field(..., description="Current page number (1-based)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    page: int = Field(..., description=_PAGE_DESC)
+    page_size: int = Field(..., description=_PAGE_SIZE_DESC)
+    total_pages: int = Field(..., description=_TOTAL_PAGES_DESC)
 
 
 class ActivityCreateRequest(BaseModel):
@@ -809,7 +871,7 @@ class PasswordResetRequest(BaseModel):
         notification_method: How to notify user (email, sms, both)
     """
     user_cid: UUID = Field(..., description="Canonical ID of the user")
-    systems: List[str] = Field(default=[], description="List of systems to reset password on (empty = all systems)")
+    systems: List[str] = Field(default_factory=list, description="List of systems to reset password on (empty = all systems)")
     force_change: bool = Field(True, description="Whether to force password change on next login")
     notification_method: str = Field("email", description="How to notify user (email, sms, both)")
 
@@ -843,7 +905,7 @@ class ForceCheckinRequest(BaseModel):
         compliance_scan: Whether to run compliance scan during check-in
         update_inventory: Whether to update device inventory
     """
-    device_ids: List[UUID] = Field(default=[], description="List of device IDs to force check-in")
+    device_ids: List[UUID] = Field(default_factory=list, description="List of device IDs to force check-in")
     user_cid: Optional[UUID] = Field(None, description="Force check-in for all devices of specific user")
     compliance_scan: bool = Field(True, description="Whether to run compliance scan during check-in")
     update_inventory: bool = Field(True, description="Whether to update device inventory")
@@ -1128,7 +1190,7 @@ class SyncRequest(BaseModel):
         sync_type: Type of sync (full, incremental, users_only, devices_only)
         force_refresh: Whether to force refresh cached data
     """
-    systems: List[str] = Field(default=[], description="List of systems to sync (empty = all configured systems)")
+    systems: List[str] = Field(default_factory=list, description="List of systems to sync (empty = all configured systems)")
     sync_type: str = Field("incremental", description="Type of sync (full, incremental, users_only, devices_only)")
     force_refresh: bool = Field(False, description="Whether to force refresh cached data")
 
@@ -1168,6 +1230,7 @@ class AdvancedMergeRequest(BaseModel):
         merge_groups: Whether to transfer group memberships
         conflict_resolution: How to handle conflicts (take_source, take_target, merge)
         preserve_history: Whether to preserve activity history
+        replay_id: Client-supplied key that makes retries of the same merge idempotent
     """
     source_cid: UUID = Field(..., description="CID of user to merge FROM")
     target_cid: UUID = Field(..., description="CID of user to merge TO")
@@ -1176,6 +1239,7 @@ class AdvancedMergeRequest(BaseModel):
     merge_groups: bool = Field(True, description="Whether to transfer group memberships")
     conflict_resolution: str = Field("take_target", description="How to handle conflicts (take_source, take_target, merge)")
     preserve_history: bool = Field(True, description="Whether to preserve activity history")
+    replay_id: Optional[UUID] = Field(None, description="Idempotency key; a retry with the same key returns the original result")
 
 
 class MergeConflict(BaseModel):
@@ -1216,6 +1280,24 @@ class MergePreviewResult(BaseModel):
     estimated_duration: float = Field(..., description="Estimated time for merge operation")
 
 
+class AdvancedMergeResult(BaseModel):
+    """
+    Result of an advanced identity merge.
+    
+    Attributes:
+        message: Human-readable result message
+        source_cid: CID of the user merged FROM
+        target_cid: CID of the user merged TO
+        items_transferred: Number of devices, accounts and groups transferred
+        conflict_resolution_applied: Conflict resolution strategy that was applied
+    """
+    message: str = Field(..., description="Human-readable result message")
+    source_cid: UUID = Field(..., description="CID of the user merged FROM")
+    target_cid: UUID = Field(..., description="CID of the user merged TO")
+    items_transferred: Dict[str, int] = Field(..., description="Number of devices, accounts and groups transferred")
+    conflict_resolution_applied: str = Field(..., description="Conflict resolution strategy that was applied")
+
+
 # API Management Schemas
 class APIConnectionTagSchema(BaseModel):
     """
@@ -1225,7 +1307,7 @@ class APIConnectionTagSchema(BaseModel):
         id: Unique tag identifier
         tag: Tag value (Production, Critical, Identity Source, etc.)
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_ENUM_RESPONSE_CONFIG
     
     id: UUID = Field(..., description="Unique tag identifier")
     tag: APIConnectionTagEnum = Field(..., description="Tag value")
@@ -1262,7 +1344,7 @@ class APIConnectionSchema(BaseModel):
         connection_test_url: Specific endpoint to test connection
         tags: List of API connection tags
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ORM_ENUM_RESPONSE_CONFIG
     
     id: UUID = Field(..., description="Unique connection identifier")
     name: str = Field(..., description="User-friendly name for the connection")
@@ -1272,14 +1354,14 @@ class APIConnectionSchema(BaseModel):
     api_version: Optional[str] = Field(None, description="API version")
     authentication_type: str = Field(..., description="Type of authentication used")
     sync_enabled: bool = Field(..., description="Whether automatic sync is enabled")
-    sync_interval_minutes: Optional[str] = Field(None, description="How often to sync in minutes")
+    sync_interval_minutes: Optional[int] = Field(None, description="How often to sync in minutes")
     last_sync: Optional[datetime] = Field(None, description="When last sync occurred")
     next_sync: Optional[datetime] = Field(None, description="When next sync is scheduled")
     status: APIConnectionStatusEnum = Field(..., description="Current connection status")
     last_health_check: Optional[datetime] = Field(None, description="When health check was last performed")
     health_check_message: Optional[str] = Field(None, description="Result of last health check")
     connection_test_url: Optional[str] = Field(None, description="Specific endpoint to test connection")
-    rate_limit_requests: Optional[str] = Field(None, description="Rate limit requests per window")
+    rate_limit_requests: Optional[int] = Field(None, description="Rate limit requests per window")
     rate_limit_window: Optional[str] = Field(None, description="Rate limit time window")
     created_at: datetime = Field(..., description="When connection was created")
     updated_at: datetime = Field(..., description="When connection was last updated")
@@ -1288,7 +1370,21 @@ class APIConnectionSchema(BaseModel):
     supports_devices: bool = Field(..., description="Whether this API supports device data")
     supports_groups: bool = Field(..., description="Whether this API supports group data")
     supports_realtime: bool = Field(..., description="Whether this API supports real-time updates")
-    tags: List[APIConnectionTagSchema] = Field(default=[], description="List of API connection tags")
+    tags: List[APIConnectionTagSchema] = Field(default_factory=list, description="List of API connection tags")
+    
+    @classmethod
+    def from_row(cls, connection) -> "APIConnectionSchema":
+        """
+        Build from a trusted APIConnection row without validation.
+        
+        Values are read from the matching attributes and used as-is; tags
+        should be eager-loaded on the row.
+        """
+        values = {name: getattr(connection, name) for name in cls.model_fields if name != "tags"}
+        return cls.model_construct(
+            **values,
+            tags=[APIConnectionTagSchema.model_construct(id=tag.id, tag=tag.tag) for tag in connection.tags]
+        )
 
 
 class APIConnectionCreateRequest(BaseModel):
@@ -1323,16 +1419,16 @@ class APIConnectionCreateRequest(BaseModel):
     authentication_type: str = Field(..., description="Type of authentication")
     credentials: str = Field(..., description="Authentication credentials (will be encrypted)")
     sync_enabled: bool = Field(True, description="Whether to enable automatic sync")
-    sync_interval_minutes: str = Field("60", description="How often to sync in minutes")
+    sync_interval_minutes: int = Field(60, description="How often to sync in minutes")
     connection_test_url: Optional[str] = Field(None, description="Specific endpoint to test connection")
-    rate_limit_requests: Optional[str] = Field(None, description="Rate limit requests per window")
+    rate_limit_requests: Optional[int] = Field(None, description="Rate limit requests per window")
     rate_limit_window: Optional[str] = Field(None, description="Rate limit time window")
     field_mappings: Optional[str] = Field(None, description="JSON configuration for field mapping")
     supports_users: bool = Field(True, description="Whether this API supports user data")
     supports_devices: bool = Field(False, description="Whether this API supports device data")
     supports_groups: bool = Field(True, description="Whether this API supports group data")
     supports_realtime: bool = Field(False, description="Whether this API supports real-time updates")
-    tags: List[APIConnectionTagEnum] = Field(default=[], description="List of tags to assign to the connection")
+    tags: List[APIConnectionTagEnum] = Field(default_factory=list, description="List of tags to assign to the connection")
 
 
 class APIConnectionUpdateRequest(BaseModel):
@@ -1363,8 +1459,8 @@ class APIConnectionUpdateRequest(BaseModel):
     authentication_type: Optional[str] = Field(None, description="New authentication type")
     credentials: Optional[str] = Field(None, description="New credentials (will be encrypted)")
     sync_enabled: Optional[bool] = Field(None, description="New sync enabled status")
-    sync_interval_minutes: Optional[str] = Field(None, description="New sync interval")
-    rate_limit_requests: Optional[str] = Field(None, description="New rate limit requests")
+    sync_interval_minutes: Optional[int] = Field(None, description="New sync interval")
+    rate_limit_requests: Optional[int] = Field(None, description="New rate limit requests")
     rate_limit_window: Optional[str] = Field(None, description="New rate limit window")
     field_mappings: Optional[str] = Field(None, description="New field mappings configuration")
     supports_users: Optional[bool] = Field(None, description="New user support status")
@@ -1386,9 +1482,9 @@ class APIConnectionListResponse(BaseModel):
     """
     connections: List[APIConnectionSchema] = Field(..., description="List of API connections for current page")
     total: int = Field(..., description="Total number of connections matching filters")
-    page: int = Field(..., description="Current page number (1-based)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    page: int = Field(..., description=_PAGE_DESC)
+    page_size: int = Field(..., description=_PAGE_SIZE_DESC)
+    total_pages: int = Field(..., description=_TOTAL_PAGES_DESC)
 
 
 class APIHealthCheckResult(BaseModel):
@@ -1429,20 +1525,29 @@ class APISyncLogSchema(BaseModel):
         records_failed: Number of records that failed
         error_message: Error message if sync failed
     """
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _ROW_RESPONSE_CONFIG
     
     id: UUID = Field(..., description="Unique log entry identifier")
     connection_id: UUID = Field(..., description="ID of the API connection")
     sync_type: str = Field(..., description="Type of sync performed")
     started_at: datetime = Field(..., description="When sync started")
     completed_at: Optional[datetime] = Field(None, description="When sync completed")
-    duration_seconds: Optional[str] = Field(None, description="How long sync took")
+    duration_seconds: Optional[float] = Field(None, description="How long sync took")
     status: str = Field(..., description="Sync result status")
-    records_processed: str = Field(..., description="Number of records processed")
-    records_created: str = Field(..., description="Number of new records created")
-    records_updated: str = Field(..., description="Number of records updated")
-    records_failed: str = Field(..., description="Number of records that failed")
+    records_processed: int = Field(..., description="Number of records processed")
+    records_created: int = Field(..., description="Number of new records created")
+    records_updated: int = Field(..., description="Number of records updated")
+    records_failed: int = Field(..., description="Number of records that failed")
     error_message: Optional[str] = Field(None, description="Error message if sync failed")
+    
+    @classmethod
+    def from_row(cls, record) -> "APISyncLogSchema":
+        """
+        Build from a trusted APISyncLog row without validation.
+        
+        Values are read from the matching attributes and used as-is.
+        """
+        return cls.model_construct(**{name: getattr(record, name) for name in cls.model_fields})
 
 
 class APISyncLogListResponse(BaseModel):
@@ -1458,6 +1563,11 @@ class APISyncLogListResponse(BaseModel):
     """
     logs: List[APISyncLogSchema] = Field(..., description="List of sync log entries for current page")
     total: int = Field(..., description="Total number of log entries matching filters")
-    page: int = Field(..., description="Current page number (1-based)")
-    page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    page: int = Field(..., description=_PAGE_DESC)
+    page_size: int = Field(..., description=_PAGE_SIZE_DESC)
+    total_pages: int = Field(..., description=_TOTAL_PAGES_DESC)
+
+
+# Build the schemas on the device and user list hot paths at import time
+DeviceSchema.model_rebuild()
+UserListItemSchema.model_rebuild()
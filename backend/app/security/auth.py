@@ -1,11 +1,70 @@
 from fastapi import HTTPException, Security, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from backend.app.config import settings
-from typing import Dict, Any, Optional
+from backend.app.security.oauth import oauth_service
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import hashlib
+import hmac
+import threading
+import time
 
 
 security = HTTPBearer()
 
+# Demo token encoded once for constant-time comparison
+_DEMO_TOKEN_BYTES = settings.demo_api_token.encode()
+
+
+# Successful OAuth verifications are reused for at most this long
+# (and never past the token's own exp claim)
+TOKEN_CACHE_TTL_SECONDS = 60
+
+# At most this many verified tokens are kept; the least recently used goes first
+TOKEN_CACHE_MAX_ENTRIES = 4096
+
+# Token digest -> (expires_at, payload), in least- to most-recently-used order
+_token_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _is_demo_token(token: str) -> bool:
+    """Compare against the demo token in constant time"""
+    return hmac.compare_digest(token.encode(), _DEMO_TOKEN_BYTES)
+
+
+def _verify_access_token(token: str) -> Dict[str, Any]:
+    """
+    Verify an OAuth access token, reusing a recent successful verification.
+    
+    Cache entries are keyed by a digest of the token rather than the token
+    itself, and callers get their own copy of the payload. Failed
+    verifications raise as before and are never cached.
+    """
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(cache_key)
+        if entry is not None:
+            expires_at, payload = entry
+            if now < expires_at:
+                _token_cache.move_to_end(cache_key)
+                return dict(payload)
+            del _token_cache[cache_key]
+    
+    payload = oauth_service.verify_access_token(token)
+    
+    ttl_seconds = TOKEN_CACHE_TTL_SECONDS
+    if "exp" in payload:
+        ttl_seconds = min(ttl_seconds, payload["exp"] - now)
+    if ttl_seconds > 0:
+        with _token_cache_lock:
+            _token_cache[cache_key] = (now + ttl_seconds, dict(payload))
+            _token_cache.move_to_end(cache_key)
+            while len(_token_cache) > TOKEN_CACHE_MAX_ENTRIES:
+                _token_cache.popitem(last=False)
+    return payload
+
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
     """
@@ -30,23 +89,19 @@ def verify_token(credentials: HTTPAuthorizationCredentials = Security(security))
     token = credentials.credentials
     
     # First, check if it's the demo token (backward compatibility)
-    if token == settings.demo_api_token:
+    if _is_demo_token(token):
         return token
     
-    # Try to verify as OAuth token
+    # Try to verify as OAuth token (the demo token has already been ruled out)
     try:
-        from backend.app.security.oauth import oauth_service
-        payload = oauth_service.verify_access_token(token)
+        _verify_access_token(token)
         return token
     except HTTPException:
-        # If OAuth token verification fails, try demo token one more time
-        if token != settings.demo_api_token:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication token",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        return token
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
 
 def verify_oauth_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> Dict[str, Any]:
@@ -72,7 +127,7 @@ def verify_oauth_token(credentials: HTTPAuthorizationCredentials = Security(secu
     token = credentials.credentials
     
     # For demo token, return mock user info
-    if token == settings.demo_api_token:
+    if _is_demo_token(token):
         return {
             "sub": "demo-user-id",
             "email": "demo@company.com",
@@ -83,9 +138,7 @@ def verify_oauth_token(credentials: HTTPAuthorizationCredentials = Security(secu
     
     # Verify OAuth token and get user info
     try:
-        from backend.app.security.oauth import oauth_service
-        payload = oauth_service.verify_access_token(token)
-        return payload
+        return _verify_access_token(token)
     except HTTPException:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -44,7 +44,7 @@ class BaseConnector(ABC):
         self._setup_authentication()
         
         # Rate limiting
-        self.rate_limit_requests = int(connection.rate_limit_requests or "100")
+        self.rate_limit_requests = connection.rate_limit_requests or 100
         self.rate_limit_window = connection.rate_limit_window or "minute"
         self.request_timestamps = []
     
@@ -130,11 +130,11 @@ class SyncOrchestrator:
             
             # Update sync log with success
             sync_log.completed_at = datetime.now()
-            sync_log.duration_seconds = str((sync_log.completed_at - sync_log.started_at).total_seconds())
+            sync_log.duration_seconds = (sync_log.completed_at - sync_log.started_at).total_seconds()
             sync_log.status = "success"
-            sync_log.records_processed = str(users_processed + devices_processed)
-            sync_log.records_created = str(self.correlation_engine.correlation_stats["users_created"])
-            sync_log.records_updated = str(self.correlation_engine.correlation_stats["users_updated"])
+            sync_log.records_processed = users_processed + devices_processed
+            sync_log.records_created = self.correlation_engine.correlation_stats["users_created"]
+            sync_log.records_updated = self.correlation_engine.correlation_stats["users_updated"]
             
             # Update connection last sync time
             connection.last_sync = datetime.now()
@@ -259,10 +259,7 @@ class SyncOrchestrator:
     
     def _calculate_next_sync(self, connection: APIConnection) -> datetime:
         """Calculate when the next sync should occur."""
-        try:
-            interval_minutes = int(connection.sync_interval_minutes or "60")
-        except (ValueError, TypeError):
-            interval_minutes = 60  # Default to 1 hour
+        interval_minutes = connection.sync_interval_minutes or 60  # Default to 1 hour
         
         return datetime.now() + timedelta(minutes=interval_minutes)
     
@@ -32,10 +32,10 @@ def apply_pagination(
     Returns:
         Tuple of (results, total_count, total_pages)
     """
-    # Get total count before pagination
-    total = query.count()
+    # Get total count before pagination (ORDER BY is irrelevant to the count, so drop it)
+    total = query.order_by(None).count()
     
-    # Apply pagination
+    # Apply pagination in SQL so only the requested page is fetched
     offset = (page - 1) * page_size
     results = query.offset(offset).limit(page_size).all()
     
@@ -98,6 +98,21 @@ def apply_text_search(
     return query
 
 
+def chunked(items: List[Any], size: int):
+    """
+    Split a list into consecutive chunks of at most `size` items.
+    
+    Args:
+        items: List to split (e.g. IDs for an IN clause)
+        size: Maximum number of items per chunk
+    
+    Yields:
+        Slices of the original list
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
 # Standard pagination parameters for FastAPI endpoints
 PaginationParams = {
     "page": FastAPIQuery(1, ge=1, description="Page number"),
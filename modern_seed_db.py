@@ -261,7 +261,7 @@ API_CONNECTIONS = [
             "client_secret": "encrypted_secret_here",
             "domain": "company.okta.com"
         }),
-        "sync_interval_minutes": "15",
+        "sync_interval_minutes": 15,
         "status": APIConnectionStatusEnum.CONNECTED,
         "tags": [APIConnectionTagEnum.PRODUCTION, APIConnectionTagEnum.IDENTITY_SOURCE, APIConnectionTagEnum.CRITICAL],
         "supports_users": True,
@@ -280,7 +280,7 @@ API_CONNECTIONS = [
             "client_id": "87654321-4321-4321-4321-210987654321",
             "client_secret": "encrypted_secret_here"
         }),
-        "sync_interval_minutes": "30",
+        "sync_interval_minutes": 30,
         "status": APIConnectionStatusEnum.CONNECTED,
         "tags": [APIConnectionTagEnum.PRODUCTION, APIConnectionTagEnum.IDENTITY_SOURCE, APIConnectionTagEnum.CRITICAL],
         "supports_users": True,
@@ -299,7 +299,7 @@ API_CONNECTIONS = [
             "client_id": "crowdstrike_client_id",
             "client_secret": "encrypted_secret_here"
         }),
-        "sync_interval_minutes": "5",
+        "sync_interval_minutes": 5,
         "status": APIConnectionStatusEnum.CONNECTED,
         "tags": [APIConnectionTagEnum.PRODUCTION, APIConnectionTagEnum.DEVICE_SOURCE, APIConnectionTagEnum.SECURITY_TOOL, APIConnectionTagEnum.REAL_TIME],
         "supports_devices": True,
@@ -316,7 +316,7 @@ API_CONNECTIONS = [
             "username": "splunk_api_user",
             "password": "encrypted_password_here"
         }),
-        "sync_interval_minutes": "10",
+        "sync_interval_minutes": 10,
         "status": APIConnectionStatusEnum.CONNECTED,
         "tags": [APIConnectionTagEnum.PRODUCTION, APIConnectionTagEnum.SECURITY_TOOL, APIConnectionTagEnum.REAL_TIME, APIConnectionTagEnum.HIGH_VOLUME],
         "supports_realtime": True
@@ -333,7 +333,7 @@ API_CONNECTIONS = [
             "client_secret": "encrypted_secret_here",
             "tenant": "company"
         }),
-        "sync_interval_minutes": "60",
+        "sync_interval_minutes": 60,
         "status": APIConnectionStatusEnum.CONNECTED,
         "tags": [APIConnectionTagEnum.PRODUCTION, APIConnectionTagEnum.HR_SYSTEM, APIConnectionTagEnum.IDENTITY_SOURCE],
         "supports_users": True,
@@ -600,7 +600,7 @@ def create_api_connections(db: Session) -> List[APIConnection]:
             sync_interval_minutes=conn_data["sync_interval_minutes"],
             status=conn_data["status"],
             connection_test_url=f"{conn_data['base_url']}/health",
-            rate_limit_requests="1000",
+            rate_limit_requests=1000,
             rate_limit_window="hour",
             field_mappings=json.dumps({"default": "standard_mapping"}),
             supports_users=conn_data.get("supports_users", False),
@@ -795,12 +795,12 @@ def create_api_sync_logs(db: Session, connections: List[APIConnection], count: i
             sync_type=sync_type,
             started_at=started_at,
             completed_at=completed_at,
-            duration_seconds=str(int(duration)),
+            duration_seconds=int(duration),
             status=status,
-            records_processed=str(random.randint(10, 1000)),
-            records_created=str(random.randint(0, 100)),
-            records_updated=str(random.randint(0, 50)),
-            records_failed=str(random.randint(0, 10)) if status in ["error", "partial"] else "0",
+            records_processed=random.randint(10, 1000),
+            records_created=random.randint(0, 100),
+            records_updated=random.randint(0, 50),
+            records_failed=random.randint(0, 10) if status in ["error", "partial"] else 0,
             error_message=fake.sentence() if status == "error" else None
         )
         db.add(sync_log)
@@ -745,7 +745,7 @@ def seed_database():
                 authentication_type=conn_data["authentication_type"],
                 credentials="encrypted_credentials_placeholder",
                 sync_enabled=True,
-                sync_interval_minutes="60",
+                sync_interval_minutes=60,
                 status=conn_data["status"],
                 last_health_check=fake.date_time_between(start_date='-1d', end_date='now'),
                 health_check_message="Connection successful" if conn_data["status"] == APIConnectionStatusEnum.CONNECTED else "Authentication failed",
@@ -773,11 +773,11 @@ def seed_database():
                         started_at=fake.date_time_between(start_date='-30d', end_date='now'),
                         completed_at=fake.date_time_between(start_date='-30d', end_date='now'),
                         status=random.choice(["success", "error", "partial"]),
-                        records_processed=str(random.randint(10, 1000)),
-                        records_created=str(random.randint(0, 50)),
-                        records_updated=str(random.randint(5, 200)),
-                        records_failed=str(random.randint(0, 5)),
-                        duration_seconds=str(random.uniform(1.0, 30.0))
+                        records_processed=random.randint(10, 1000),
+                        records_created=random.randint(0, 50),
+                        records_updated=random.randint(5, 200),
+                        records_failed=random.randint(0, 5),
+                        duration_seconds=random.uniform(1.0, 30.0)
                     )
                     db.add(sync_log)
         